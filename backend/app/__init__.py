@@ -42,6 +42,10 @@ def create_app(config_name='default'):
     CORS(app, resources={r"/*": {"origins": "*"}})
     jwt = JWTManager(app)
 
+    # Clear the per-request user cache used by the auth decorators
+    from app.middleware.auth import reset_current_user
+    app.before_request(reset_current_user)
+
     # Import models to register with SQLAlchemy
     # This must happen after db initialization
     with app.app_context():
@@ -7,6 +7,7 @@ Ensures single source of truth for application configuration.
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 from app.patterns.singleton import SingletonMeta
 
 # Load environment variables from .env file
@@ -41,6 +42,9 @@ class Config(metaclass=SingletonMeta):
     JWT_HEADER_NAME = 'Authorization'
     JWT_HEADER_TYPE = 'Bearer'
 
+    # Password Hashing (bcrypt cost factor)
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+
     # CORS Configuration - Allow Blazor frontend origins
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:5112,http://localhost:5222,https://localhost:5001,http://localhost:5000,https://localhost:7001').split(',')
 
@@ -66,9 +70,19 @@ class DevelopmentConfig(Config):
 
 class TestingConfig(Config):
     """Testing-specific configuration"""
+    DEBUG = False
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # One shared connection keeps the in-memory schema visible to every
+    # request thread (Flask-SQLAlchemy defaults to this, made explicit here).
+    # Each pytest-xdist worker is its own process, so gets its own database.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
     SQLALCHEMY_ECHO = False
+    # Minimum bcrypt cost: hashes stay valid but take ~1ms instead of ~250ms
+    BCRYPT_LOG_ROUNDS = 4
 
 
 class ProductionConfig(Config):
@@ -13,7 +13,7 @@ OOP Principles:
 """
 
 from functools import wraps
-from flask import jsonify
+from flask import jsonify, g
 from flask_jwt_extended import (
     verify_jwt_in_request,
     get_jwt_identity,
@@ -70,9 +70,7 @@ def admin_required():
                 verify_jwt_in_request()
 
                 # Get user from JWT (convert string to int)
-                user_id = int(get_jwt_identity())
-                user_repo = UserRepository()
-                user = user_repo.get_by_id(user_id)
+                user = load_user(get_jwt_identity())
 
                 if not user:
                     return jsonify({
@@ -132,9 +130,7 @@ def technician_required():
                 verify_jwt_in_request()
 
                 # Get user from JWT (convert string to int)
-                user_id = int(get_jwt_identity())
-                user_repo = UserRepository()
-                user = user_repo.get_by_id(user_id)
+                user = load_user(get_jwt_identity())
 
                 if not user:
                     return jsonify({
@@ -175,6 +171,42 @@ def technician_required():
     return decorator
 
 
+def load_user(user_id):
+    """
+    Load a user by id, reusing the copy cached on g for this request.
+
+    The auth decorators and get_current_user() both resolve the JWT
+    identity to a user row; caching it on g.current_user means an
+    authenticated call issues one SELECT instead of one per lookup.
+
+    Args:
+        user_id: User ID taken from the JWT identity (str or int), or
+            None when the identity carries no user id
+
+    Returns:
+        User: User object or None
+    """
+    if user_id is None:
+        return None
+    user_id = int(user_id)
+
+    user = g.get('current_user')
+    if user is None or user.id != user_id:
+        user = UserRepository().get_by_id(user_id)
+        g.current_user = user
+    return user
+
+
+def reset_current_user():
+    """
+    Drop the user cached on g before each request.
+
+    g lives on the app context, which outlives a single request when one
+    is already pushed (e.g. in tests), so the cache is cleared explicitly.
+    """
+    g.pop('current_user', None)
+
+
 def get_current_user():
     """
     Helper function to get the current authenticated user.
@@ -190,9 +222,7 @@ def get_current_user():
             return user.to_dict()
     """
     try:
-        user_id = int(get_jwt_identity())
-        user_repo = UserRepository()
-        return user_repo.get_by_id(user_id)
+        return load_user(get_jwt_identity())
     except:
         return None
 
@@ -5,7 +5,7 @@ Middleware for enforcing permission-based access control on endpoints
 from functools import wraps
 from flask import jsonify, g
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
-from app.repositories.user_repository import UserRepository
+from app.middleware.auth import load_user
 from app.repositories.permission_repository import PermissionRepository
 
 
@@ -33,8 +33,7 @@ def require_permission(permission_name):
                 user_id = identity.get('user_id') if isinstance(identity, dict) else identity
 
                 # Get user from database
-                user_repo = UserRepository()
-                user = user_repo.get_by_id(user_id)
+                user = load_user(user_id)
 
                 if not user:
                     return jsonify({
@@ -84,8 +83,7 @@ def require_any_permission(*permission_names):
                 identity = get_jwt_identity()
                 user_id = identity.get('user_id') if isinstance(identity, dict) else identity
 
-                user_repo = UserRepository()
-                user = user_repo.get_by_id(user_id)
+                user = load_user(user_id)
 
                 if not user:
                     return jsonify({
@@ -135,8 +133,7 @@ def require_all_permissions(*permission_names):
                 identity = get_jwt_identity()
                 user_id = identity.get('user_id') if isinstance(identity, dict) else identity
 
-                user_repo = UserRepository()
-                user = user_repo.get_by_id(user_id)
+                user = load_user(user_id)
 
                 if not user:
                     return jsonify({
@@ -212,8 +209,7 @@ def optional_permission(permission_name):
                 identity = get_jwt_identity()
                 user_id = identity.get('user_id') if isinstance(identity, dict) else identity
 
-                user_repo = UserRepository()
-                user = user_repo.get_by_id(user_id)
+                user = load_user(user_id)
 
                 if user:
                     g.has_permission = user.has_permission_by_name(permission_name)
@@ -8,6 +8,19 @@ from app.repositories.tenant_repository import TenantRepository
 from app.models.tenant import TenantStatus
 
 
+# Endpoints served without a tenant context
+PUBLIC_ENDPOINTS = frozenset({
+    '/api/v1/auth/register',
+    '/api/v1/auth/login',
+    '/api/v1/tenants/register',  # Tenant registration
+    '/health',
+    '/api/docs'
+})
+
+# Hosts that resolve to the default tenant in local development
+LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '0.0.0.0'})
+
+
 class TenantMiddleware:
     """
     Middleware to extract and validate tenant context from requests.
@@ -53,7 +66,7 @@ class TenantMiddleware:
         host = request.host.split(':')[0]  # Remove port if present
 
         # Development/localhost handling
-        if host in ['localhost', '127.0.0.1', '0.0.0.0']:
+        if host in LOCAL_HOSTS:
             return 'app'  # Default tenant for local development
 
         # Production subdomain extraction
@@ -78,15 +91,7 @@ class TenantMiddleware:
             None or error response if tenant invalid
         """
         # Skip tenant loading for public endpoints
-        public_endpoints = [
-            '/api/v1/auth/register',
-            '/api/v1/auth/login',
-            '/api/v1/tenants/register',  # Tenant registration
-            '/health',
-            '/api/docs'
-        ]
-
-        if request.path in public_endpoints or request.path.startswith('/static'):
+        if request.path in PUBLIC_ENDPOINTS or request.path.startswith('/static'):
             g.current_tenant_id = None
             g.current_tenant = None
             return None
@@ -54,6 +54,17 @@ class Asset(BaseModel):
     """
 
     __tablename__ = 'assets'
+    __table_args__ = (
+        db.Index('ix_assets_building_floor', 'building', 'floor'),
+        # Trigram indexes let PostgreSQL answer search_assets' ILIKE '%term%'
+        # without a sequential scan; other databases skip them
+        db.Index('ix_assets_name_trgm', 'name', postgresql_using='gin',
+                 postgresql_ops={'name': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_assets_description_trgm', 'description', postgresql_using='gin',
+                 postgresql_ops={'description': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_assets_asset_tag_trgm', 'asset_tag', postgresql_using='gin',
+                 postgresql_ops={'asset_tag': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+    )
 
     # Basic Information
     name = db.Column(db.String(200), nullable=False)
@@ -61,7 +72,7 @@ class Asset(BaseModel):
     asset_tag = db.Column(db.String(50), unique=True, nullable=False, index=True)
 
     # Classification
-    category = db.Column(db.Enum(AssetCategory), nullable=False)
+    category = db.Column(db.Enum(AssetCategory), nullable=False, index=True)
     subcategory = db.Column(db.String(100), nullable=True)
 
     # Location
@@ -71,8 +82,8 @@ class Asset(BaseModel):
     location_details = db.Column(db.String(255), nullable=True)
 
     # Status and Condition
-    status = db.Column(db.Enum(AssetStatus), nullable=False, default=AssetStatus.ACTIVE)
-    condition = db.Column(db.Enum(AssetCondition), nullable=False, default=AssetCondition.GOOD)
+    status = db.Column(db.Enum(AssetStatus), nullable=False, default=AssetStatus.ACTIVE, index=True)
+    condition = db.Column(db.Enum(AssetCondition), nullable=False, default=AssetCondition.GOOD, index=True)
 
     # Maintenance Information
     manufacturer = db.Column(db.String(100), nullable=True)
@@ -255,3 +266,12 @@ class Asset(BaseModel):
             data['warranty_expiry'] = self.warranty_expiry.isoformat()
 
         return data
+
+
+# gin_trgm_ops comes from the pg_trgm extension, which must exist before
+# db.create_all() builds the trigram indexes above
+db.event.listen(
+    Asset.__table__,
+    'before_create',
+    db.DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
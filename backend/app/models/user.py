@@ -10,6 +10,7 @@ Demonstrates:
 import re
 import bcrypt
 from enum import Enum
+from flask import current_app, has_app_context
 from app.models.base import BaseModel
 from app.database import db
 
@@ -119,8 +120,10 @@ class User(BaseModel):
         if not password or len(password) < 6:
             raise ValueError("Password must be at least 6 characters long")
 
-        # Generate salt and hash password
-        salt = bcrypt.gensalt()
+        # Generate salt and hash password (cost factor is configurable so
+        # tests can use a cheap one; bcrypt's default is 12)
+        rounds = current_app.config.get('BCRYPT_LOG_ROUNDS', 12) if has_app_context() else 12
+        salt = bcrypt.gensalt(rounds=rounds)
         self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
     def check_password(self, password):
@@ -56,7 +56,7 @@ class LoggingObserver(Observer):
             Formatted log string
         """
         timestamp = event.timestamp.isoformat()
-        event_id = event.event_id[:8]
+        event_id = event.event_id
         source = event.source or "Unknown"
 
         # Format data as key-value pairs
@@ -5,6 +5,7 @@ Tracks KPIs and metrics based on system events.
 """
 
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import Dict
 from app.patterns.observer import Observer, Event
@@ -27,14 +28,16 @@ class MetricsObserver(Observer):
     def __init__(self):
         """Initialize metrics observer."""
         self._logger = logging.getLogger(f"{__name__}.MetricsObserver")
-        self._metrics: Dict[str, any] = {
-            'requests_created': 0,
-            'requests_completed': 0,
-            'requests_by_type': {},
-            'technician_workload': {},
-            'assets_created': 0,
-            'condition_changes': 0
-        }
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        """Initialize counters; keyed tallies use Counter for cheap bumps."""
+        self._requests_created = 0
+        self._requests_completed = 0
+        self._assets_created = 0
+        self._condition_changes = 0
+        self._by_type: Counter = Counter()
+        self._workload: Counter = Counter()
 
     @property
     def name(self) -> str:
@@ -69,70 +72,79 @@ class MetricsObserver(Observer):
 
     def _track_request_created(self, data: dict) -> None:
         """Track new request creation."""
-        self._metrics['requests_created'] += 1
+        self._requests_created += 1
+        self._by_type[data.get('type', 'unknown')] += 1
 
-        request_type = data.get('type', 'unknown')
-        if request_type not in self._metrics['requests_by_type']:
-            self._metrics['requests_by_type'][request_type] = 0
-        self._metrics['requests_by_type'][request_type] += 1
-
-        self._logger.debug(f"[Metrics] Total requests created: {self._metrics['requests_created']}")
+        self._logger.debug(f"[Metrics] Total requests created: {self._requests_created}")
 
     def _track_request_completed(self, data: dict) -> None:
         """Track request completion."""
-        self._metrics['requests_completed'] += 1
+        self._requests_completed += 1
 
         completion_rate = (
-            self._metrics['requests_completed'] / self._metrics['requests_created'] * 100
-            if self._metrics['requests_created'] > 0 else 0
+            self._requests_completed / self._requests_created * 100
+            if self._requests_created > 0 else 0
         )
 
         self._logger.info(
             f"[Metrics] Request completed. "
             f"Completion rate: {completion_rate:.1f}% "
-            f"({self._metrics['requests_completed']}/{self._metrics['requests_created']})"
+            f"({self._requests_completed}/{self._requests_created})"
         )
 
     def _track_request_assigned(self, data: dict) -> None:
         """Track technician workload."""
         technician_id = data.get('technician_id')
         if technician_id:
-            if technician_id not in self._metrics['technician_workload']:
-                self._metrics['technician_workload'][technician_id] = 0
-            self._metrics['technician_workload'][technician_id] += 1
+            self._workload[technician_id] += 1
 
             self._logger.debug(
                 f"[Metrics] Technician {technician_id} workload: "
-                f"{self._metrics['technician_workload'][technician_id]} requests"
+                f"{self._workload[technician_id]} requests"
             )
 
     def _track_asset_created(self, data: dict) -> None:
         """Track asset creation."""
-        self._metrics['assets_created'] += 1
-        self._logger.debug(f"[Metrics] Total assets: {self._metrics['assets_created']}")
+        self._assets_created += 1
+        self._logger.debug(f"[Metrics] Total assets: {self._assets_created}")
 
     def _track_condition_change(self, data: dict) -> None:
         """Track asset condition changes."""
-        self._metrics['condition_changes'] += 1
-        self._logger.debug(f"[Metrics] Condition changes: {self._metrics['condition_changes']}")
+        self._condition_changes += 1
+        self._logger.debug(f"[Metrics] Condition changes: {self._condition_changes}")
 
     def get_metrics(self) -> Dict:
         """
         Get current metrics.
 
+        The returned dictionary is built fresh on each call, so callers
+        may mutate it without affecting the observer.
+
         Returns:
             Dictionary of current metrics
         """
-        return self._metrics.copy()
+        return {
+            'requests_created': self._requests_created,
+            'requests_completed': self._requests_completed,
+            'requests_by_type': dict(self._by_type),
+            'technician_workload': dict(self._workload),
+            'assets_created': self._assets_created,
+            'condition_changes': self._condition_changes
+        }
+
+    def get_workload(self, technician_id: int) -> int:
+        """
+        Get the number of requests assigned to a technician.
+
+        Args:
+            technician_id: ID of the technician
+
+        Returns:
+            Assigned request count (0 if none)
+        """
+        return self._workload.get(technician_id, 0)
 
     def reset_metrics(self) -> None:
         """Reset all metrics to zero."""
-        self._metrics = {
-            'requests_created': 0,
-            'requests_completed': 0,
-            'requests_by_type': {},
-            'technician_workload': {},
-            'assets_created': 0,
-            'condition_changes': 0
-        }
+        self._reset_counters()
         self._logger.info("[Metrics] Metrics reset")
@@ -20,6 +20,9 @@ class NotificationObserver(Observer):
     notifications through the NotificationService using the Strategy pattern.
     """
 
+    # Not prefers_async: the notification_service calls need the Flask
+    # app context, which pool threads don't have
+
     def __init__(self, notification_service):
         """
         Initialize notification observer.
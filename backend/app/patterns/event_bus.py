@@ -11,11 +11,17 @@ Key Features:
 - Subscribe/unsubscribe functionality
 - Query history by event type or time range
 - Automatic event timestamping and ID generation
+- Optional thread-pool dispatch for I/O-bound observers
+- Batch publishing of several events in one call
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Deque, Dict, Iterable, List, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
 import logging
+import threading
 
 from app.patterns.singleton import SingletonMeta
 from app.patterns.observer import Subject, Event, Observer
@@ -45,12 +51,64 @@ class EventBus(Subject, metaclass=SingletonMeta):
     def __init__(self):
         """Initialize EventBus with empty history."""
         super().__init__()
-        self._event_history: List[Event] = []
-        self._max_history_size = 1000
+        # Guards history, the type index and the executor; deferred
+        # observers may publish from pool threads
+        self._lock = threading.Lock()
+        self._reset_history()
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._logger = logging.getLogger(f"{__name__}.EventBus")
         self._logger.info("EventBus initialized")
 
-    def publish(self, event_type: str, data: Dict[str, Any], source: Optional[str] = None) -> Event:
+    def _reset_history(self) -> None:
+        """Set history, history size and clock to their initial state."""
+        self._max_history_size = 1000
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history_size)
+        # Same events as _event_history, split by type (oldest-first per type)
+        self._history_by_type: Dict[str, Deque[Event]] = {}
+        # Source of event timestamps; tests replace it with a fake clock
+        self._clock: Callable[[], datetime] = datetime.utcnow
+
+    @classmethod
+    def _reset_for_tests(cls) -> 'EventBus':
+        """
+        Reset the singleton to its initial state and return it.
+
+        Clears observers and history in place, restores the default
+        history size and clock, and shuts down the dispatch pool. The
+        instance itself is kept, so the singletons of other classes are
+        left untouched.
+
+        Returns:
+            EventBus: The reset singleton instance
+        """
+        bus = cls()
+        bus.shutdown()
+        bus._observers.clear()
+        with bus._lock:
+            bus._reset_history()
+        return bus
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the thread pool used for deferred observers.
+
+        A later publish(sync=False) starts a new pool.
+
+        Args:
+            wait: Block until observers already submitted have finished
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        source: Optional[str] = None,
+        sync: bool = True
+    ) -> Event:
         """
         Publish event to all subscribed observers.
 
@@ -61,6 +119,9 @@ class EventBus(Subject, metaclass=SingletonMeta):
             event_type: Type of event (e.g., 'REQUEST_CREATED')
             data: Event payload data
             source: Optional source identifier (e.g., 'MaintenanceService.create_request')
+            sync: If False, observers with ``prefers_async`` set are run on a
+                shared thread pool instead of inline; the rest still run
+                inline, in order. Failures of deferred observers are logged.
 
         Returns:
             Event: The published event object
@@ -73,20 +134,106 @@ class EventBus(Subject, metaclass=SingletonMeta):
             )
         """
         # Create event
-        event = Event(event_type, data, source)
+        event = Event(event_type, data, source, timestamp=self._clock())
 
         # Add to history
         self._add_to_history(event)
 
-        # Notify observers
-        result = self.notify(event)
+        # Dispatch only when subscribed - skips result bookkeeping and logging
+        if self._observers.get(event_type):
+            self._dispatch(event, sync)
+
+        return event
+
+    def publish_many(
+        self,
+        events: Iterable[Tuple[str, Dict[str, Any], Optional[str]]],
+        sync: bool = True
+    ) -> List[Event]:
+        """
+        Publish several events in order.
+
+        Behaves like calling publish() for each item, with the per-call
+        attribute lookups done once for the whole batch.
+
+        Args:
+            events: (event_type, data, source) tuples; source may be None
+            sync: Passed through to dispatch, as for publish()
+
+        Returns:
+            List of the published events, in the order given
+
+        Example:
+            event_bus.publish_many([
+                ('ASSET_CREATED', {'asset_id': 1}, 'AssetService'),
+                ('ASSET_CREATED', {'asset_id': 2}, 'AssetService'),
+            ])
+        """
+        clock = self._clock
+        add_to_history = self._add_to_history
+        observers = self._observers
+        published = []
+
+        for event_type, data, source in events:
+            event = Event(event_type, data, source, timestamp=clock())
+            add_to_history(event)
+            if observers.get(event_type):
+                self._dispatch(event, sync)
+            published.append(event)
+
+        return published
+
+    def _dispatch(self, event: Event, sync: bool) -> None:
+        """Notify the observers of an already recorded event and log the outcome."""
+        if sync:
+            result = self.notify(event)
+        else:
+            result = self._notify_deferred(event)
 
         self._logger.info(
-            f"Published {event_type} (id={event.event_id[:8]}) - "
-            f"{result['success_count']} successful, {result['failure_count']} failed"
+            "Published %s (id=%s) - %d successful, %d failed",
+            event.event_type, event.event_id, result['success_count'], result['failure_count']
         )
 
-        return event
+    def _notify_deferred(self, event: Event) -> Dict[str, Any]:
+        """
+        Run async-preferring observers on the thread pool, the rest inline.
+
+        Args:
+            event: Event to notify observers about
+
+        Returns:
+            Notification results for the inline observers, plus
+            'deferred_count' for observers submitted to the pool
+        """
+        observers = self._observers.get(event.event_type, ())
+        inline = [o for o in observers if not o.prefers_async]
+        deferred = [o for o in observers if o.prefers_async]
+
+        result = self._notify_observers(event, inline)
+
+        if deferred:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='evbus')
+                executor = self._executor
+            for observer in deferred:
+                future = executor.submit(observer.update, event)
+                future.add_done_callback(
+                    lambda f, observer=observer: self._log_deferred_failure(f, observer, event)
+                )
+
+        result['deferred_count'] = len(deferred)
+        return result
+
+    def _log_deferred_failure(self, future: Future, observer: Observer, event: Event) -> None:
+        """Log an exception raised by an observer run on the thread pool."""
+        error = future.exception()
+        if error is not None:
+            self._logger.error(
+                "✗ %s failed to handle %s: %s", observer.name, event.event_type, error,
+                exc_info=error
+            )
 
     def subscribe(self, event_type: str, observer: Observer) -> None:
         """
@@ -133,7 +280,9 @@ class EventBus(Subject, metaclass=SingletonMeta):
             source: Optional filter by event source
 
         Returns:
-            List of events matching filters, newest first
+            List of events matching filters, most recently recorded first
+            (timestamps usually follow that order, but a concurrent publish
+            or a clock step can record an older timestamp later)
 
         Example:
             # Get last 50 REQUEST_CREATED events
@@ -143,23 +292,26 @@ class EventBus(Subject, metaclass=SingletonMeta):
             one_hour_ago = datetime.utcnow() - timedelta(hours=1)
             events = event_bus.get_history(since=one_hour_ago)
         """
-        filtered_events = self._event_history.copy()
-
-        # Filter by event type
-        if event_type:
-            filtered_events = [e for e in filtered_events if e.event_type == event_type]
-
-        # Filter by timestamp
-        if since:
-            filtered_events = [e for e in filtered_events if e.timestamp >= since]
-
-        # Filter by source
-        if source:
-            filtered_events = [e for e in filtered_events if e.source == source]
-
-        # Sort by timestamp (newest first) and limit
-        filtered_events.sort(key=lambda e: e.timestamp, reverse=True)
-        return filtered_events[:limit]
+        # History is stored in recording order, so walking it in reverse yields
+        # the most recently recorded first; filters are lazy so iteration stops
+        # after `limit` matches.
+        # A type filter reads that type's index instead of scanning all events.
+        with self._lock:
+            if event_type:
+                events = reversed(self._history_by_type.get(event_type, ()))
+            else:
+                events = reversed(self._event_history)
+
+            # Filter by timestamp - every event is checked, since history order
+            # need not match timestamp order (concurrent publishes, clock steps)
+            if since:
+                events = (e for e in events if e.timestamp >= since)
+
+            # Filter by source
+            if source:
+                events = (e for e in events if e.source == source)
+
+            return list(islice(events, limit))
 
     def get_history_count(
         self,
@@ -180,6 +332,11 @@ class EventBus(Subject, metaclass=SingletonMeta):
             total_events = event_bus.get_history_count()
             request_events = event_bus.get_history_count('REQUEST_CREATED')
         """
+        if since is None:
+            if event_type:
+                return len(self._history_by_type.get(event_type, ()))
+            return len(self._event_history)
+
         return len(self.get_history(event_type=event_type, since=since, limit=999999))
 
     def clear_history(self, event_type: Optional[str] = None) -> int:
@@ -195,15 +352,22 @@ class EventBus(Subject, metaclass=SingletonMeta):
         Warning:
             Use with caution - this permanently removes event history
         """
+        with self._lock:
+            if event_type:
+                count = len(self._history_by_type.pop(event_type, ()))
+                if count:
+                    self._event_history = deque(
+                        (e for e in self._event_history if e.event_type != event_type),
+                        maxlen=self._max_history_size
+                    )
+            else:
+                count = len(self._event_history)
+                self._event_history.clear()
+                self._history_by_type.clear()
+
         if event_type:
-            events_to_remove = [e for e in self._event_history if e.event_type == event_type]
-            for event in events_to_remove:
-                self._event_history.remove(event)
-            count = len(events_to_remove)
             self._logger.warning(f"Cleared {count} events of type {event_type} from history")
         else:
-            count = len(self._event_history)
-            self._event_history.clear()
             self._logger.warning(f"Cleared all {count} events from history")
 
         return count
@@ -225,7 +389,18 @@ class EventBus(Subject, metaclass=SingletonMeta):
             stats = event_bus.get_statistics()
             print(f"Total events: {stats['total_events']}")
         """
-        if not self._event_history:
+        with self._lock:
+            history = self._event_history
+            total_events = len(history)
+            oldest = history[0].timestamp.isoformat() if history else None
+            newest = history[-1].timestamp.isoformat() if history else None
+
+            # Count events by type
+            event_type_counts = {
+                event_type: len(events) for event_type, events in self._history_by_type.items()
+            }
+
+        if not total_events:
             return {
                 'total_events': 0,
                 'event_type_counts': {},
@@ -235,23 +410,18 @@ class EventBus(Subject, metaclass=SingletonMeta):
                 'newest_event': None
             }
 
-        # Count events by type
-        event_type_counts = {}
-        for event in self._event_history:
-            event_type_counts[event.event_type] = event_type_counts.get(event.event_type, 0) + 1
-
         # Count observers by event type
         observers_by_event = {}
         for event_type, observer_list in self._observers.items():
             observers_by_event[event_type] = len(observer_list)
 
         return {
-            'total_events': len(self._event_history),
+            'total_events': total_events,
             'event_type_counts': event_type_counts,
             'observer_count': self.get_observer_count(),
             'observers_by_event': observers_by_event,
-            'oldest_event': self._event_history[0].timestamp.isoformat() if self._event_history else None,
-            'newest_event': self._event_history[-1].timestamp.isoformat() if self._event_history else None
+            'oldest_event': oldest,
+            'newest_event': newest
         }
 
     def _add_to_history(self, event: Event) -> None:
@@ -262,15 +432,27 @@ class EventBus(Subject, metaclass=SingletonMeta):
             event: Event to add to history
 
         Note:
-            If history exceeds max size, oldest events are removed.
+            History is a bounded deque, so once it is full the oldest
+            event is dropped in O(1) on each append. The per-type index
+            drops the same event, which is always the oldest of its type.
         """
-        self._event_history.append(event)
-
-        # Trim history if it exceeds max size
-        if len(self._event_history) > self._max_history_size:
-            overflow = len(self._event_history) - self._max_history_size
-            self._event_history = self._event_history[overflow:]
-            self._logger.debug(f"Trimmed {overflow} old events from history")
+        with self._lock:
+            history = self._event_history
+            if len(history) == history.maxlen:
+                evicted = history[0]
+                type_events = self._history_by_type[evicted.event_type]
+                type_events.popleft()
+                if not type_events:
+                    del self._history_by_type[evicted.event_type]
+
+            history.append(event)
+            self._history_by_type.setdefault(event.event_type, deque()).append(event)
+
+    def _rebuild_type_index(self) -> None:
+        """Rebuild the per-type index from the full history (hold _lock)."""
+        self._history_by_type = {}
+        for event in self._event_history:
+            self._history_by_type.setdefault(event.event_type, deque()).append(event)
 
     def set_max_history_size(self, size: int) -> None:
         """
@@ -288,13 +470,17 @@ class EventBus(Subject, metaclass=SingletonMeta):
         if size < 1:
             raise ValueError("Max history size must be at least 1")
 
-        old_size = self._max_history_size
-        self._max_history_size = size
+        with self._lock:
+            old_size = self._max_history_size
+            self._max_history_size = size
 
-        # Trim if current history exceeds new max
-        if len(self._event_history) > size:
+            # Trim if current history exceeds new max
             overflow = len(self._event_history) - size
-            self._event_history = self._event_history[overflow:]
+            self._event_history = deque(self._event_history, maxlen=size)
+            if overflow > 0:
+                self._rebuild_type_index()
+
+        if overflow > 0:
             self._logger.info(f"Trimmed {overflow} events after reducing max history size")
 
         self._logger.info(f"Max history size changed from {old_size} to {size}")
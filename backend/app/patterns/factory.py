@@ -15,7 +15,7 @@ OOP Principles:
 - Polymorphism: Returns appropriate subclass based on type
 """
 
-from typing import Optional
+from typing import Optional, Tuple
 from app.models.request import (
     MaintenanceRequest,
     ElectricalRequest,
@@ -46,6 +46,33 @@ class MaintenanceRequestFactory:
         RequestType.HVAC: HVACRequest,
     }
 
+    # Immutable snapshot of the registry keys, refreshed on registration
+    _supported_types = tuple(_request_types)
+
+    # Fields create_request_from_dict requires (asset_id is optional)
+    _required_fields = ('title', 'description', 'submitter_id')
+
+    # Type-specific fields read by create_request_from_dict, with their defaults
+    _type_fields = {
+        RequestType.ELECTRICAL: {
+            'voltage': None,
+            'circuit_number': None,
+            'breaker_location': None,
+            'is_emergency': False,
+        },
+        RequestType.PLUMBING: {
+            'pipe_type': None,
+            'water_pressure': None,
+            'leak_severity': None,
+            'water_shutoff_required': False,
+        },
+        RequestType.HVAC: {
+            'system_type': None,
+            'temperature_issue': None,
+            'refrigerant_leak': False,
+        },
+    }
+
     @classmethod
     def create_request(cls, request_type: RequestType, title: str, description: str,
                        submitter_id: int, asset_id: Optional[int] = None,
@@ -307,9 +334,8 @@ class MaintenanceRequestFactory:
             'category': data.get('category'),
         }
 
-        # Validate required fields (asset_id is optional)
-        required_fields = ['title', 'description', 'submitter_id']
-        for field in required_fields:
+        # Validate required fields
+        for field in cls._required_fields:
             if common_fields.get(field) is None:
                 raise ValueError(f"{field} is required")
 
@@ -322,27 +348,10 @@ class MaintenanceRequestFactory:
                 common_fields['priority'] = priority_str
 
         # Copy type-specific fields
-        type_specific_fields = {}
-        if request_type == RequestType.ELECTRICAL:
-            type_specific_fields = {
-                'voltage': data.get('voltage'),
-                'circuit_number': data.get('circuit_number'),
-                'breaker_location': data.get('breaker_location'),
-                'is_emergency': data.get('is_emergency', False),
-            }
-        elif request_type == RequestType.PLUMBING:
-            type_specific_fields = {
-                'pipe_type': data.get('pipe_type'),
-                'water_pressure': data.get('water_pressure'),
-                'leak_severity': data.get('leak_severity'),
-                'water_shutoff_required': data.get('water_shutoff_required', False),
-            }
-        elif request_type == RequestType.HVAC:
-            type_specific_fields = {
-                'system_type': data.get('system_type'),
-                'temperature_issue': data.get('temperature_issue'),
-                'refrigerant_leak': data.get('refrigerant_leak', False),
-            }
+        type_specific_fields = {
+            field: data.get(field, default)
+            for field, default in cls._type_fields.get(request_type, {}).items()
+        }
 
         # Create request using factory method
         return cls.create_request(
@@ -352,7 +361,8 @@ class MaintenanceRequestFactory:
         )
 
     @classmethod
-    def register_request_type(cls, request_type: RequestType, request_class: type):
+    def register_request_type(cls, request_type: RequestType, request_class: type,
+                              fields: Optional[dict] = None):
         """
         Register a new request type (for future extensibility).
 
@@ -362,6 +372,9 @@ class MaintenanceRequestFactory:
         Args:
             request_type: RequestType enum value
             request_class: MaintenanceRequest subclass
+            fields: Type-specific fields create_request_from_dict should
+                copy, mapped to their defaults (optional; when omitted an
+                already registered type keeps its existing fields)
 
         Example:
             # In future, if we add GeneralRequest type
@@ -371,13 +384,16 @@ class MaintenanceRequestFactory:
             )
         """
         cls._request_types[request_type] = request_class
+        if fields is not None:
+            cls._type_fields[request_type] = dict(fields)
+        cls._supported_types = tuple(cls._request_types)
 
     @classmethod
-    def get_supported_types(cls) -> list:
+    def get_supported_types(cls) -> Tuple[RequestType, ...]:
         """
-        Get list of supported request types.
+        Get supported request types.
 
         Returns:
-            List of RequestType enum values
+            Tuple of RequestType enum values (shared, not copied per call)
         """
-        return list(cls._request_types.keys())
+        return cls._supported_types
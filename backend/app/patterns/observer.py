@@ -11,13 +11,31 @@ Components:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
+from itertools import count
+import os
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Event IDs keep the UUID shape: a random prefix drawn once per process
+# followed by a per-process sequence number, which keeps them unique without
+# calling uuid4() on every publish. The prefix is redrawn in forked workers.
+_event_sequence = count()
+_event_id_prefix = str(uuid.uuid4())[:24]
+
+
+def _reseed_event_ids() -> None:
+    """Draw a new event ID prefix (called in forked child processes)."""
+    global _event_id_prefix
+    _event_id_prefix = str(uuid.uuid4())[:24]
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_event_ids)
+
 
 class Event:
     """
@@ -27,7 +45,13 @@ class Event:
     components may want to react to.
     """
 
-    def __init__(self, event_type: str, data: Dict[str, Any], source: Optional[str] = None):
+    def __init__(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        source: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ):
         """
         Initialize event.
 
@@ -35,12 +59,13 @@ class Event:
             event_type: Type of event (e.g., 'REQUEST_CREATED')
             data: Event payload data
             source: Optional source identifier (e.g., 'MaintenanceService.create_request')
+            timestamp: Optional time of the event (defaults to now, UTC)
         """
         self.event_type = event_type
         self.data = data
         self.source = source
-        self.timestamp = datetime.utcnow()
-        self.event_id = str(uuid.uuid4())
+        self.timestamp = timestamp if timestamp is not None else datetime.utcnow()
+        self.event_id = f"{_event_id_prefix}{next(_event_sequence):012x}"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary."""
@@ -54,7 +79,7 @@ class Event:
 
     def __repr__(self) -> str:
         """String representation of event."""
-        return f"Event(type={self.event_type}, id={self.event_id[:8]}, source={self.source})"
+        return f"Event(type={self.event_type}, id={self.event_id}, source={self.source})"
 
 
 class Observer(ABC):
@@ -63,8 +88,15 @@ class Observer(ABC):
 
     Observers implement the update method to handle specific events.
     Multiple observers can subscribe to the same event type.
+
+    Observers whose work is I/O-bound (e.g. sending email/SMS) and that do
+    not rely on the publisher's thread-local state (Flask app context, DB
+    session) can set ``prefers_async = True`` so EventBus.publish(sync=False)
+    runs them on a worker thread.
     """
 
+    prefers_async: bool = False
+
     @abstractmethod
     def update(self, event: Event) -> None:
         """
@@ -99,14 +131,18 @@ class Subject:
     """
     Base subject that manages observers and notifies them of events.
 
-    Maintains a dictionary of event types to lists of observers.
+    Maintains a dictionary of event types to tuples of observers.
     When an event is published, all observers subscribed to that
     event type are notified.
+
+    The tuples are never mutated: attach/detach replace them. A dispatch
+    that is in progress keeps iterating the tuple it started with, even if an
+    observer subscribes or unsubscribes while it runs.
     """
 
     def __init__(self):
         """Initialize subject with empty observer registry."""
-        self._observers: Dict[str, List[Observer]] = {}
+        self._observers: Dict[str, Tuple[Observer, ...]] = {}
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def attach(self, event_type: str, observer: Observer) -> None:
@@ -120,11 +156,10 @@ class Subject:
         Example:
             subject.attach('REQUEST_CREATED', notification_observer)
         """
-        if event_type not in self._observers:
-            self._observers[event_type] = []
+        observers = self._observers.get(event_type, ())
 
-        if observer not in self._observers[event_type]:
-            self._observers[event_type].append(observer)
+        if observer not in observers:
+            self._observers[event_type] = observers + (observer,)
             self._logger.debug(f"Attached {observer.name} to {event_type}")
         else:
             self._logger.warning(f"{observer.name} already attached to {event_type}")
@@ -141,14 +176,17 @@ class Subject:
             subject.detach('REQUEST_CREATED', notification_observer)
         """
         if event_type in self._observers:
-            try:
-                self._observers[event_type].remove(observer)
-                self._logger.debug(f"Detached {observer.name} from {event_type}")
-
-                # Clean up empty observer lists
-                if not self._observers[event_type]:
+            observers = self._observers[event_type]
+            if observer in observers:
+                remaining = tuple(o for o in observers if o is not observer)
+
+                # Clean up empty observer tuples
+                if remaining:
+                    self._observers[event_type] = remaining
+                else:
                     del self._observers[event_type]
-            except ValueError:
+                self._logger.debug(f"Detached {observer.name} from {event_type}")
+            else:
                 self._logger.warning(f"{observer.name} not found in {event_type} observers")
 
     def notify(self, event: Event) -> Dict[str, Any]:
@@ -171,18 +209,30 @@ class Subject:
             event = Event('REQUEST_CREATED', {'request_id': 1})
             result = subject.notify(event)
         """
+        return self._notify_observers(event, self._observers.get(event.event_type, ()))
+
+    def _notify_observers(self, event: Event, observers: Sequence[Observer]) -> Dict[str, Any]:
+        """
+        Notify the given observers of event, isolating failures.
+
+        Args:
+            event: Event to notify observers about
+            observers: Observers to call, in order
+
+        Returns:
+            Dict with notification results (see notify)
+        """
         event_type = event.event_type
-        observers = self._observers.get(event_type, [])
 
         if not observers:
-            self._logger.debug(f"No observers for event {event_type}")
+            self._logger.debug("No observers for event %s", event_type)
             return {
                 'success_count': 0,
                 'failure_count': 0,
                 'failures': []
             }
 
-        self._logger.info(f"Notifying {len(observers)} observers of {event_type}")
+        self._logger.info("Notifying %d observers of %s", len(observers), event_type)
 
         success_count = 0
         failure_count = 0
@@ -192,12 +242,12 @@ class Subject:
             try:
                 observer.update(event)
                 success_count += 1
-                self._logger.debug(f"✓ {observer.name} handled {event_type}")
+                self._logger.debug("✓ %s handled %s", observer.name, event_type)
             except Exception as e:
                 failure_count += 1
                 failures.append(observer.name)
                 self._logger.error(
-                    f"✗ {observer.name} failed to handle {event_type}: {str(e)}",
+                    "✗ %s failed to handle %s: %s", observer.name, event_type, e,
                     exc_info=True
                 )
 
@@ -207,7 +257,7 @@ class Subject:
             'failures': failures
         }
 
-    def get_observers(self, event_type: Optional[str] = None) -> Dict[str, List[Observer]]:
+    def get_observers(self, event_type: Optional[str] = None) -> Dict[str, Tuple[Observer, ...]]:
         """
         Get registered observers.
 
@@ -215,14 +265,14 @@ class Subject:
             event_type: Optional event type to filter by
 
         Returns:
-            Dict mapping event types to observer lists
+            Dict mapping event types to observer tuples
 
         Example:
             all_observers = subject.get_observers()
             request_observers = subject.get_observers('REQUEST_CREATED')
         """
         if event_type:
-            return {event_type: self._observers.get(event_type, [])}
+            return {event_type: self._observers.get(event_type, ())}
         return self._observers.copy()
 
     def get_observer_count(self, event_type: Optional[str] = None) -> int:
@@ -5,6 +5,8 @@ Extends BaseRepository with location and condition-based queries.
 """
 
 from typing import List, Optional
+from sqlalchemy import func
+from app.database import db
 from app.repositories.base_repository import BaseRepository
 from app.models.asset import Asset, AssetCategory, AssetCondition, AssetStatus
 
@@ -45,7 +47,7 @@ class AssetRepository(BaseRepository[Asset]):
         Returns:
             True if exists, False otherwise
         """
-        return self.get_by_asset_tag(asset_tag) is not None
+        return self.exists_by_filter(asset_tag=asset_tag)
 
     def get_by_category(self, category: AssetCategory) -> List[Asset]:
         """
@@ -168,8 +170,6 @@ class AssetRepository(BaseRepository[Asset]):
         Returns:
             List of matching assets
         """
-        from app.database import db
-
         search_pattern = f"%{search_term}%"
 
         return db.session.query(Asset).filter(
@@ -305,20 +305,20 @@ class AssetRepository(BaseRepository[Asset]):
         Returns:
             Dictionary with asset counts by status and condition
         """
+        query = db.session.query(Asset.status, Asset.condition, func.count(Asset.id))
+        query = self._apply_tenant_filter(query).group_by(Asset.status, Asset.condition)
+
+        # One grouped query; every status and condition is reported, even at zero
+        by_status = {status.value: 0 for status in AssetStatus}
+        by_condition = {condition.value: 0 for condition in AssetCondition}
+        for status, condition, count in query.all():
+            by_status[status.value] += count
+            by_condition[condition.value] += count
+
         return {
-            'total_assets': self.count(),
-            'by_status': {
-                'active': self.count(status=AssetStatus.ACTIVE),
-                'in_repair': self.count(status=AssetStatus.IN_REPAIR),
-                'out_of_service': self.count(status=AssetStatus.OUT_OF_SERVICE),
-                'retired': self.count(status=AssetStatus.RETIRED),
-            },
-            'by_condition': {
-                'excellent': self.count(condition=AssetCondition.EXCELLENT),
-                'good': self.count(condition=AssetCondition.GOOD),
-                'fair': self.count(condition=AssetCondition.FAIR),
-                'poor': self.count(condition=AssetCondition.POOR),
-                'critical': self.count(condition=AssetCondition.CRITICAL),
-            },
-            'needs_maintenance': len(self.get_assets_needing_maintenance())
+            'total_assets': sum(by_status.values()),
+            'by_status': by_status,
+            'by_condition': by_condition,
+            'needs_maintenance': (by_condition[AssetCondition.POOR.value]
+                                  + by_condition[AssetCondition.CRITICAL.value])
         }
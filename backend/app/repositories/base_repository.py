@@ -17,6 +17,7 @@ OOP Principles:
 """
 
 from typing import TypeVar, Generic, List, Optional, Type
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from flask import g, has_request_context
 from app.database import db
@@ -299,7 +300,22 @@ class BaseRepository(Generic[T]):
         Returns:
             True if exists, False otherwise
         """
-        query = db.session.query(self.model_class).filter_by(id=id)
+        return self.exists_by_filter(bypass_tenant_filter, id=id)
+
+    def exists_by_filter(self, bypass_tenant_filter: bool = False, **filters) -> bool:
+        """
+        Check if any instance matches filter criteria.
+
+        Issues a single EXISTS query instead of loading a matching row.
+
+        Args:
+            bypass_tenant_filter: If True, skip tenant filtering (for admin operations)
+            **filters: Field name and value pairs
+
+        Returns:
+            True if at least one instance matches, False otherwise
+        """
+        query = db.session.query(self.model_class).filter_by(**filters)
         query = self._apply_tenant_filter(query, bypass_tenant_filter)
         return db.session.query(query.exists()).scalar()
 
@@ -323,7 +339,8 @@ class BaseRepository(Generic[T]):
 
         query = self._apply_tenant_filter(query, bypass_tenant_filter)
 
-        return query.count()
+        # Plain SELECT count(...) rather than Query.count()'s subquery wrapper
+        return query.with_entities(func.count(self.model_class.id)).scalar()
 
     def bulk_create(self, instances: List[T]) -> List[T]:
         """
@@ -86,7 +86,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             True if email exists, False otherwise
         """
-        return self.get_by_email(email) is not None
+        return self.exists_by_filter(email=email.lower())
 
     def authenticate(self, email: str, password: str) -> Optional[User]:
         """
@@ -13,6 +13,10 @@ from app.patterns.event_bus import EventBus
 from app.events.event_types import EventTypes
 
 
+# Condition values accepted from clients, mapped to the enum
+CONDITION_LOOKUP = {condition.value: condition for condition in AssetCondition}
+
+
 class AssetService(BaseService):
     """
     Service for asset management operations.
@@ -98,9 +102,8 @@ class AssetService(BaseService):
         try:
             self._validate_positive(asset_id, 'asset_id')
 
-            try:
-                condition_enum = AssetCondition(new_condition.lower())
-            except ValueError:
+            condition_enum = CONDITION_LOOKUP.get(new_condition.lower())
+            if condition_enum is None:
                 return self._build_error_response(f"Invalid condition: {new_condition}")
 
             # Get asset to capture old condition
@@ -0,0 +1,39 @@
+"""add pg_trgm indexes for asset search
+
+Revision ID: c41d8e9f0a7b
+Revises: b7e3f1a2c9d4
+Create Date: 2026-10-16 11:40:27.905114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d8e9f0a7b'
+down_revision = 'b7e3f1a2c9d4'
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = ('name', 'description', 'asset_tag')
+
+
+def upgrade():
+    # Trigram GIN indexes are PostgreSQL-only; SQLite keeps scanning for ILIKE
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_assets_{column}_trgm', 'assets', [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f'ix_assets_{column}_trgm', table_name='assets')
@@ -2,14 +2,46 @@
 Test configuration and fixtures.
 
 Provides reusable test fixtures for all test modules.
+
+The app, test client and database schema are built once per session;
+each test that takes db_session runs in its own transaction, which is
+rolled back afterwards.
 """
 
+import functools
+import logging
+from contextlib import contextmanager
+
 import pytest
+from flask_jwt_extended import create_access_token
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy import event
 from app import create_app
 from app.database import db
-from app.models import User, Asset, MaintenanceRequest, UserRole, AssetCategory, AssetStatus, AssetCondition
+from app.models import (
+    User, Asset, MaintenanceRequest, ElectricalRequest, UserRole, AssetCategory, AssetStatus,
+    AssetCondition, RequestStatus, RequestPriority
+)
 from app.models.permission import Permission
 from app.models.role import Role
+from app.patterns.factory import MaintenanceRequestFactory
+from app.repositories import RequestRepository, UserRepository, AssetRepository
+from app.services.maintenance_service import MaintenanceService
+from app.services.notification_service import NotificationService
+
+
+@pytest.fixture(scope='session', autouse=True)
+def quiet_logging():
+    """
+    Drop INFO and DEBUG log records for the whole test run.
+
+    Services, observers and the app factory log every action at INFO,
+    which under test is only record-building overhead. Warnings and
+    errors still reach pytest's log capture.
+    """
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
 
 
 @pytest.fixture(scope='session')
@@ -23,34 +55,118 @@ def app():
     return app
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def client(app):
     """
     Flask test client for making requests.
+
+    Shared across the session: the API is stateless (JWT in headers, no
+    cookies), and per-test isolation comes from db_session's rollback.
+    Each client call pushes its own request context; the per-test app
+    context is pushed by db_session, so tests that never touch the
+    database pay for neither.
     """
     return app.test_client()
 
 
+class ConnectionBoundSession(FlaskSession):
+    """
+    Flask-SQLAlchemy session that honours an explicit ``bind``.
+
+    Flask-SQLAlchemy always resolves the app's engine, which would let
+    queries escape the per-test transaction that ``db_session`` joins.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.bind is not None:
+            return self.bind
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@pytest.fixture(scope='session')
+def database(app):
+    """
+    Create all tables once for the whole test session.
+
+    pysqlite's implicit transaction handling breaks SAVEPOINTs, so
+    SQLAlchemy is made to emit BEGIN itself (see the SQLAlchemy SQLite
+    dialect docs, "Serializable isolation / Savepoints").
+    """
+    with app.app_context():
+        engine = db.engine
+
+        @event.listens_for(engine, 'connect')
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, 'begin')
+        def _emit_begin(connection):
+            connection.exec_driver_sql('BEGIN')
+
+        db.create_all()
+
+    yield db
+
+    with app.app_context():
+        db.drop_all()
+
+
 @pytest.fixture(scope='function')
-def db_session(app):
+def db_session(app, database):
     """
     Database session for testing with automatic cleanup.
 
-    Creates all tables before test, drops after test.
+    Each test runs inside an outer transaction that is rolled back on
+    teardown. ``db.session`` is joined to it in SAVEPOINT mode, so
+    ``commit()`` calls from fixtures and application code only release a
+    savepoint and nothing outlives the test. (This is SQLAlchemy 2.0's
+    built-in form of the older begin_nested() + after_transaction_end
+    restart recipe.)
+
+    Objects are not expired on commit, so reading a fixture's attributes
+    after it commits does not issue a SELECT. Tests that need to observe
+    changes made by another request should refresh() explicitly.
     """
     with app.app_context():
-        # Create all tables
-        db.create_all()
+        connection = db.engine.connect()
+        transaction = connection.begin()
+
+        app_session = db.session
+        db.session = db._make_scoped_session({
+            'class_': ConnectionBoundSession,
+            'bind': connection,
+            'join_transaction_mode': 'create_savepoint',
+            'expire_on_commit': False
+        })
 
         yield db
 
         # Clean up after test
         db.session.remove()
-        db.drop_all()
+        db.session = app_session
+        transaction.rollback()
+        connection.close()
+
+
+TEST_PASSWORD = 'password123'
+
+
+@pytest.fixture(scope='session')
+def password_hash(app):
+    """
+    Hash of TEST_PASSWORD, computed once per test session.
+
+    bcrypt is deliberately slow, so user fixtures share this hash instead
+    of calling set_password() for every row they insert.
+    """
+    with app.app_context():
+        user = User()
+        user.set_password(TEST_PASSWORD)
+    return user.password_hash
 
 
 @pytest.fixture
-def sample_user(db_session):
+def sample_user(db_session, password_hash):
     """
     Create a sample user for testing.
 
@@ -62,9 +178,9 @@ def sample_user(db_session):
         first_name='Test',
         last_name='User',
         role=UserRole.CLIENT,
-        is_active=True
+        is_active=True,
+        password_hash=password_hash
     )
-    user.set_password('password123')
 
     db_session.session.add(user)
     db_session.session.commit()
@@ -73,7 +189,7 @@ def sample_user(db_session):
 
 
 @pytest.fixture
-def sample_technician(db_session):
+def sample_technician(db_session, password_hash):
     """
     Create a sample technician for testing.
 
@@ -85,9 +201,9 @@ def sample_technician(db_session):
         first_name='John',
         last_name='Technician',
         role=UserRole.TECHNICIAN,
-        is_active=True
+        is_active=True,
+        password_hash=password_hash
     )
-    user.set_password('password123')
 
     db_session.session.add(user)
     db_session.session.commit()
@@ -96,7 +212,7 @@ def sample_technician(db_session):
 
 
 @pytest.fixture
-def sample_admin(db_session):
+def sample_admin(db_session, password_hash):
     """
     Create a sample admin for testing.
 
@@ -108,9 +224,9 @@ def sample_admin(db_session):
         first_name='Admin',
         last_name='User',
         role=UserRole.ADMIN,
-        is_active=True
+        is_active=True,
+        password_hash=password_hash
     )
-    user.set_password('password123')
 
     db_session.session.add(user)
     db_session.session.commit()
@@ -143,10 +259,10 @@ def sample_asset(db_session):
     return asset
 
 
-@pytest.fixture
-def multiple_users(db_session):
+def build_multiple_users(password_hash):
     """
-    Create multiple users with different roles.
+    Build (unsaved) users with different roles: 2 admins, 3 technicians
+    and 5 clients.
 
     Returns:
         List of User instances
@@ -160,9 +276,9 @@ def multiple_users(db_session):
             first_name=f'Admin{i}',
             last_name='User',
             role=UserRole.ADMIN,
-            is_active=True
+            is_active=True,
+            password_hash=password_hash
         )
-        user.set_password('password123')
         users.append(user)
 
     # Create 3 technicians
@@ -172,9 +288,9 @@ def multiple_users(db_session):
             first_name=f'Tech{i}',
             last_name='User',
             role=UserRole.TECHNICIAN,
-            is_active=True
+            is_active=True,
+            password_hash=password_hash
         )
-        user.set_password('password123')
         users.append(user)
 
     # Create 5 clients
@@ -184,95 +300,497 @@ def multiple_users(db_session):
             first_name=f'Client{i}',
             last_name='User',
             role=UserRole.CLIENT,
-            is_active=True
+            is_active=True,
+            password_hash=password_hash
         )
-        user.set_password('password123')
         users.append(user)
 
+    return users
+
+
+@pytest.fixture
+def multiple_users(db_session, password_hash):
+    """
+    Create multiple users with different roles.
+
+    Returns:
+        List of User instances
+    """
+    users = build_multiple_users(password_hash)
+
     db_session.session.add_all(users)
     db_session.session.commit()
 
     return users
 
 
+@contextmanager
+def committed_for_module(app, rows):
+    """
+    Insert rows for a module-scoped fixture.
+
+    The rows are committed outside the per-test transaction, so every
+    test in the module sees them until the context exits (at module
+    teardown), when they are deleted. The row objects are refreshed and
+    detached, so their loaded attributes stay readable from any test.
+    """
+    with app.app_context():
+        db.session.add_all(rows)
+        db.session.commit()
+        for row in rows:
+            db.session.refresh(row)
+        db.session.expunge_all()
+
+    yield rows
+
+    with app.app_context():
+        for model in {type(row) for row in rows}:
+            ids = [row.id for row in rows if type(row) is model]
+            db.session.execute(db.delete(model).where(model.id.in_(ids)))
+        db.session.commit()
+
+
+@pytest.fixture(scope='module')
+def multiple_users_readonly(app, database, password_hash):
+    """
+    Same users as multiple_users, inserted once per test module.
+
+    Only for tests that read them; tests that change users should take
+    multiple_users.
+
+    Returns:
+        List of User instances (detached)
+    """
+    users = build_multiple_users(password_hash)
+    with committed_for_module(app, users):
+        yield users
+
+
+@pytest.fixture(scope='module')
+def module_asset(app, database):
+    """
+    An active asset inserted once per test module.
+
+    For tests that only need an asset id; tests that change the asset
+    should take sample_asset.
+
+    Returns:
+        Asset instance (detached)
+    """
+    asset = Asset(
+        name='Module Test Asset',
+        asset_tag='ASSET-MOD-001',
+        category=AssetCategory.ELECTRICAL,
+        status=AssetStatus.ACTIVE,
+        condition=AssetCondition.GOOD,
+        building='Main Building',
+        floor='1',
+        room='101'
+    )
+    with committed_for_module(app, [asset]):
+        yield asset
+
+
+@pytest.fixture(scope='module')
+def module_user(app, database, password_hash):
+    """
+    An active client user inserted once per test module.
+
+    For tests that never change the user; pair with module_client_token.
+
+    Returns:
+        User instance (client role, detached)
+    """
+    user = User(
+        email='module.user@example.com',
+        first_name='Test',
+        last_name='User',
+        role=UserRole.CLIENT,
+        is_active=True,
+        password_hash=password_hash
+    )
+    with committed_for_module(app, [user]):
+        yield user
+
+
+@pytest.fixture(scope='module')
+def module_admin(app, database, password_hash):
+    """
+    An active admin inserted once per test module.
+
+    For tests that never change the admin; pair with module_admin_token.
+
+    Returns:
+        User instance (admin role, detached)
+    """
+    user = User(
+        email='module.admin@example.com',
+        first_name='Admin',
+        last_name='User',
+        role=UserRole.ADMIN,
+        is_active=True,
+        password_hash=password_hash
+    )
+    with committed_for_module(app, [user]):
+        yield user
+
+
+@pytest.fixture(scope='module')
+def module_technician(app, database, password_hash):
+    """
+    An active technician inserted once per test module.
+
+    For tests that never change the technician; pair with
+    module_technician_token. Changes made inside a test are still rolled
+    back with that test's transaction.
+
+    Returns:
+        User instance (technician role, detached)
+    """
+    user = User(
+        email='module.tech@example.com',
+        first_name='John',
+        last_name='Technician',
+        role=UserRole.TECHNICIAN,
+        is_active=True,
+        password_hash=password_hash
+    )
+    with committed_for_module(app, [user]):
+        yield user
+
+
+def multiple_asset_rows(tag_prefix='ASSET'):
+    """
+    Column values for 10 assets cycling through categories, statuses and
+    conditions.
+
+    Args:
+        tag_prefix: Prefix for the asset tags, so module-wide copies don't
+            clash with per-test fixtures such as sample_asset
+
+    Returns:
+        List of dicts keyed by Asset column name
+    """
+    categories = [AssetCategory.ELECTRICAL, AssetCategory.PLUMBING, AssetCategory.HVAC]
+    statuses = [AssetStatus.ACTIVE, AssetStatus.IN_REPAIR, AssetStatus.OUT_OF_SERVICE]
+    conditions = [AssetCondition.EXCELLENT, AssetCondition.GOOD, AssetCondition.FAIR, AssetCondition.POOR]
+
+    return [
+        {
+            'name': f'Asset {i}',
+            'asset_tag': f'{tag_prefix}-{i:03d}',
+            'category': categories[i % len(categories)],
+            'status': statuses[i % len(statuses)],
+            'condition': conditions[i % len(conditions)],
+            'building': 'Building A',
+            'floor': str((i % 3) + 1),
+            'room': str(100 + i)
+        }
+        for i in range(10)
+    ]
+
+
 @pytest.fixture
 def multiple_assets(db_session):
     """
     Create multiple assets with different statuses and conditions.
 
+    The rows go in as one INSERT ... RETURNING rather than ten unit-of-work
+    inserts; the returned Asset objects are in the session as usual.
+
     Returns:
         List of Asset instances
     """
-    assets = []
+    assets = db_session.session.scalars(
+        db.insert(Asset).returning(Asset), multiple_asset_rows()
+    ).all()
+    db_session.session.commit()
 
-    categories = [AssetCategory.ELECTRICAL, AssetCategory.PLUMBING, AssetCategory.HVAC]
-    statuses = [AssetStatus.ACTIVE, AssetStatus.IN_REPAIR, AssetStatus.OUT_OF_SERVICE]
-    conditions = [AssetCondition.EXCELLENT, AssetCondition.GOOD, AssetCondition.FAIR, AssetCondition.POOR]
+    return assets
+
+
+@pytest.fixture(scope='module')
+def multiple_assets_readonly(app, database):
+    """
+    Same assets as multiple_assets, inserted once per test module.
+
+    Tagged ASSET-RO-nnn so they can sit alongside sample_asset. Only for
+    tests that read them; tests that change assets should take
+    multiple_assets.
+
+    Returns:
+        List of Asset instances (detached)
+    """
+    assets = [Asset(**row) for row in multiple_asset_rows(tag_prefix='ASSET-RO')]
+    with committed_for_module(app, assets):
+        yield assets
+
+
+# Service-layer setup helpers
+#
+# Multi-step endpoint tests only exercise their final transition over HTTP;
+# the states leading up to it are reached through MaintenanceService directly.
+
+@pytest.fixture
+def maintenance_service(db_session):
+    """
+    MaintenanceService wired to the default repositories.
+
+    Returns:
+        MaintenanceService instance
+    """
+    user_repo = UserRepository()
+    return MaintenanceService(
+        RequestRepository(), user_repo, AssetRepository(),
+        NotificationService(user_repository=user_repo),
+        MaintenanceRequestFactory()
+    )
+
+
+@pytest.fixture
+def make_request(maintenance_service, sample_user, sample_asset):
+    """
+    Create a maintenance request without going through the API.
+
+    Defaults to an electrical request submitted by sample_user against
+    sample_asset; any keyword overrides the matching create_request argument.
+
+    Returns:
+        Callable returning the created request as a dict
+    """
+    def _make_request(**overrides):
+        fields = {
+            'request_type': 'electrical',
+            'submitter_id': sample_user.id,
+            'asset_id': sample_asset.id,
+            'title': 'Test Request',
+            'description': 'Test description',
+            'priority': 'medium',
+        }
+        fields.update(overrides)
+        result = maintenance_service.create_request(**fields)
+        assert result['success'], result
+        return result['data']
+
+    return _make_request
+
+
+@pytest.fixture
+def assign_request(maintenance_service, sample_admin):
+    """
+    Assign a request (as created by make_request) to a technician.
+
+    Returns:
+        Callable returning the updated request as a dict
+    """
+    def _assign_request(req, technician):
+        result = maintenance_service.assign_request(req['id'], technician.id, sample_admin.id)
+        assert result['success'], result
+        return result['data']
+
+    return _assign_request
+
+
+@pytest.fixture
+def start_request(maintenance_service):
+    """
+    Start work on an assigned request as its technician.
+
+    Returns:
+        Callable returning the updated request as a dict
+    """
+    def _start_request(req):
+        result = maintenance_service.start_work(req['id'], req['assigned_technician_id'])
+        assert result['success'], result
+        return result['data']
+
+    return _start_request
+
+
+@pytest.fixture
+def drive_request(maintenance_service, assign_request, start_request):
+    """
+    Walk a request through assign, start and complete up to a target status.
+
+    For workflow tests whose assertions are about one late step: everything
+    before it runs through the service layer instead of one HTTP call per
+    transition.
+
+    Returns:
+        Callable returning the request as a dict once it reaches ``to``
+    """
+    def _drive_request(req, technician, to=RequestStatus.COMPLETED):
+        req = assign_request(req, technician)
+        if to == RequestStatus.ASSIGNED:
+            return req
+
+        req = start_request(req)
+        if to == RequestStatus.IN_PROGRESS:
+            return req
 
-    for i in range(10):
-        asset = Asset(
-            name=f'Asset {i}',
-            asset_tag=f'ASSET-{i:03d}',
-            category=categories[i % len(categories)],
-            status=statuses[i % len(statuses)],
-            condition=conditions[i % len(conditions)],
-            building='Building A',
-            floor=str((i % 3) + 1),
-            room=str(100 + i)
+        result = maintenance_service.complete_request(
+            req['id'], technician.id, 'Completed during test setup', 1.0
         )
-        assets.append(asset)
+        assert result['success'], result
+        return result['data']
+
+    return _drive_request
+
 
-    db_session.session.add_all(assets)
+@pytest.fixture
+def in_progress_request(db_session, sample_user, sample_technician, sample_asset):
+    """
+    Insert an electrical request already in progress with sample_technician.
+
+    Seeds the row directly, for tests that only care about what happens
+    after work has started.
+
+    Returns:
+        ElectricalRequest instance
+    """
+    request = ElectricalRequest(
+        title='In Progress Request',
+        description='Test description',
+        submitter_id=sample_user.id,
+        asset_id=sample_asset.id,
+        priority=RequestPriority.HIGH,
+        status=RequestStatus.IN_PROGRESS,
+        assigned_technician_id=sample_technician.id,
+        voltage='220V',
+        circuit_number='C8',
+        breaker_location='Panel F'
+    )
+    db_session.session.add(request)
     db_session.session.commit()
 
-    return assets
+    return request
+
+
+@pytest.fixture
+def insert_requests(db_session, sample_user, sample_asset):
+    """
+    Insert submitted electrical requests directly, skipping the API and
+    the service layer.
+
+    Returns:
+        Callable taking a count and returning the inserted ElectricalRequest rows
+    """
+    def _insert_requests(count):
+        requests = [
+            ElectricalRequest(
+                title=f'Request {i + 1}',
+                description=f'Test description {i + 1}',
+                submitter_id=sample_user.id,
+                asset_id=sample_asset.id,
+                priority=RequestPriority.MEDIUM,
+                status=RequestStatus.SUBMITTED,
+                voltage='110V',
+                circuit_number=f'C{i + 1}',
+                breaker_location='Panel A'
+            )
+            for i in range(count)
+        ]
+        db_session.session.add_all(requests)
+        db_session.session.commit()
+        return requests
+
+    return _insert_requests
 
 
 # JWT Token Fixtures for API Testing
 
+def issue_token(app, user):
+    """
+    Sign an access token with the same claims as /api/v1/auth/login.
+
+    Skips the login round trip (and its bcrypt check) for tests that only
+    need to be authenticated; login itself is covered by the auth tests.
+    """
+    return _signed_token(app, user.id, user.email, user.role.value)
+
+
+@functools.lru_cache(maxsize=None)
+def _signed_token(app, user_id, email, role):
+    """
+    Token for one set of claims, signed once per test session.
+
+    Fixture users are recreated every test but come back with the same
+    claims, so the cached token stays valid for them.
+    """
+    with app.app_context():
+        return create_access_token(
+            identity=str(user_id),
+            additional_claims={
+                'email': email,
+                'role': role
+            }
+        )
+
+
 @pytest.fixture
-def admin_token(client, sample_admin):
+def admin_token(app, sample_admin):
     """
-    Get JWT access token for admin user by logging in.
+    JWT access token for admin user.
 
     Returns:
         str: JWT access token
     """
-    response = client.post('/api/v1/auth/login', json={
-        'email': sample_admin.email,
-        'password': 'password123'
-    })
-    return response.get_json()['access_token']
+    return issue_token(app, sample_admin)
 
 
 @pytest.fixture
-def technician_token(client, sample_technician):
+def technician_token(app, sample_technician):
     """
-    Get JWT access token for technician user by logging in.
+    JWT access token for technician user.
 
     Returns:
         str: JWT access token
     """
-    response = client.post('/api/v1/auth/login', json={
-        'email': sample_technician.email,
-        'password': 'password123'
-    })
-    return response.get_json()['access_token']
+    return issue_token(app, sample_technician)
 
 
 @pytest.fixture
-def client_token(client, sample_user):
+def client_token(app, sample_user):
+    """
+    JWT access token for client user.
+
+    Returns:
+        str: JWT access token
+    """
+    return issue_token(app, sample_user)
+
+
+@pytest.fixture(scope='module')
+def module_admin_token(app, module_admin):
+    """
+    JWT access token for module_admin.
+
+    Returns:
+        str: JWT access token
+    """
+    return issue_token(app, module_admin)
+
+
+@pytest.fixture(scope='module')
+def module_technician_token(app, module_technician):
     """
-    Get JWT access token for client user by logging in.
+    JWT access token for module_technician.
 
     Returns:
         str: JWT access token
     """
-    response = client.post('/api/v1/auth/login', json={
-        'email': sample_user.email,
-        'password': 'password123'
-    })
-    return response.get_json()['access_token']
+    return issue_token(app, module_technician)
+
+
+@pytest.fixture(scope='module')
+def module_client_token(app, module_user):
+    """
+    JWT access token for module_user (client role).
+
+    Returns:
+        str: JWT access token
+    """
+    return issue_token(app, module_user)
 
 
 @pytest.fixture
@@ -309,18 +827,25 @@ def auth_headers_client(client_token):
 
 
 @pytest.fixture
-def admin_permissions_token(client, admin_with_permissions):
+def admin_permissions_token(app, admin_with_permissions):
     """
-    Get JWT access token for admin user with RBAC permissions.
+    JWT access token for admin user with RBAC permissions.
 
     Returns:
         str: JWT access token
     """
-    response = client.post('/api/v1/auth/login', json={
-        'email': admin_with_permissions.email,
-        'password': 'password123'
-    })
-    return response.get_json()['access_token']
+    return issue_token(app, admin_with_permissions)
+
+
+@pytest.fixture
+def auth_headers_admin_permissions(admin_permissions_token):
+    """
+    Authorization headers for admin user with RBAC permissions.
+
+    Returns:
+        dict: Headers with Bearer token
+    """
+    return {'Authorization': f'Bearer {admin_permissions_token}'}
 
 
 # RBAC Fixtures
@@ -410,7 +935,7 @@ def sample_system_role(db_session, sample_permissions):
 
 
 @pytest.fixture
-def user_with_roles(db_session, sample_role, sample_system_role):
+def user_with_roles(db_session, sample_role, sample_system_role, password_hash):
     """
     Create a user with multiple roles assigned.
 
@@ -422,9 +947,9 @@ def user_with_roles(db_session, sample_role, sample_system_role):
         first_name='RBAC',
         last_name='User',
         role=UserRole.CLIENT,
-        is_active=True
+        is_active=True,
+        password_hash=password_hash
     )
-    user.set_password('password123')
 
     db_session.session.add(user)
     db_session.session.commit()
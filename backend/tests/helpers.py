@@ -0,0 +1,40 @@
+"""
+Test helpers.
+
+Plain functions shared by test modules (fixtures live in conftest.py).
+"""
+
+import orjson
+
+
+def jget(response):
+    """
+    Decode a test client response body as JSON.
+
+    Uses orjson instead of Flask's get_json(), which re-parses the body
+    with the stdlib decoder on every call. Keep get_json() for tests that
+    rely on its silent=True behaviour.
+
+    Args:
+        response: Flask test client response
+
+    Returns:
+        Decoded JSON body
+    """
+    return orjson.loads(response.get_data())
+
+
+def post_json(client, url, **kwargs):
+    """
+    POST through the test client and decode the response once.
+
+    Args:
+        client: Flask test client
+        url: Request URL
+        **kwargs: Passed through to client.post (headers, json, ...)
+
+    Returns:
+        tuple: (status_code, decoded JSON body)
+    """
+    response = client.post(url, **kwargs)
+    return response.status_code, jget(response)
@@ -35,11 +35,8 @@ from app.models import (
 @pytest.fixture
 def event_bus():
     """Get fresh EventBus instance for each test."""
-    bus = EventBus()
-    # Clear any existing subscriptions
-    bus._observers = {}
-    bus._event_history = []
-    return bus
+    # Clear any existing subscriptions and history
+    return EventBus._reset_for_tests()
 
 
 @pytest.fixture
@@ -119,12 +116,13 @@ def sample_assigned_request(db_session, sample_user, sample_asset, sample_techni
     return request
 
 
+@pytest.mark.integration
 class TestRequestLifecycleEventFlow:
     """Test complete request lifecycle with event propagation."""
 
-    def test_create_request_publishes_event(self, client, sample_user, sample_asset, observers):
+    def test_create_request_publishes_event(self, client, sample_user, sample_asset,
+                                           event_bus, observers):
         """Test that creating a request publishes REQUEST_CREATED event."""
-        event_bus = EventBus()
         metrics_obs = observers['metrics']
 
         # Create maintenance service
@@ -167,9 +165,9 @@ class TestRequestLifecycleEventFlow:
         assert history[0].data['type'] == 'electrical'
 
     def test_assign_request_publishes_event(self, client, sample_request,
-                                           sample_user, sample_technician, observers):
+                                           sample_user, sample_technician,
+                                           event_bus, observers):
         """Test that assigning a request publishes REQUEST_ASSIGNED event."""
-        event_bus = EventBus()
         metrics_obs = observers['metrics']
 
         request_repo = RequestRepository()
@@ -184,7 +182,7 @@ class TestRequestLifecycleEventFlow:
         )
 
         # Get initial metrics
-        initial_workload = metrics_obs.get_metrics()['technician_workload'].copy()
+        initial_workload = metrics_obs.get_workload(sample_technician.id)
 
         # Assign request
         result = service.assign_request(
@@ -197,8 +195,7 @@ class TestRequestLifecycleEventFlow:
 
         # Verify metrics updated
         metrics = metrics_obs.get_metrics()
-        assert metrics['technician_workload'][sample_technician.id] == \
-               initial_workload.get(sample_technician.id, 0) + 1
+        assert metrics['technician_workload'][sample_technician.id] == initial_workload + 1
 
         # Verify event in history
         history = event_bus.get_history(event_type=EventTypes.REQUEST_ASSIGNED, limit=1)
@@ -206,9 +203,8 @@ class TestRequestLifecycleEventFlow:
         assert history[0].data['technician_id'] == sample_technician.id
 
     def test_complete_request_publishes_event(self, client, sample_assigned_request,
-                                             sample_technician, observers):
+                                             sample_technician, event_bus, observers):
         """Test that completing a request publishes REQUEST_COMPLETED event."""
-        event_bus = EventBus()
         metrics_obs = observers['metrics']
 
         request_repo = RequestRepository()
@@ -252,12 +248,12 @@ class TestRequestLifecycleEventFlow:
         assert history[0].data['actual_hours'] == 2.5
 
 
+@pytest.mark.integration
 class TestAssetEventFlow:
     """Test asset-related event flow."""
 
-    def test_update_condition_publishes_event(self, client, sample_asset, observers):
+    def test_update_condition_publishes_event(self, client, sample_asset, event_bus, observers):
         """Test that updating asset condition publishes ASSET_CONDITION_CHANGED event."""
-        event_bus = EventBus()
         metrics_obs = observers['metrics']
 
         asset_repo = AssetRepository()
@@ -285,6 +281,7 @@ class TestAssetEventFlow:
         assert history[0].data['asset_id'] == sample_asset.id
 
 
+@pytest.mark.integration
 class TestMultipleObserversReceiveEvents:
     """Test that multiple observers all receive the same events."""
 
@@ -332,9 +329,14 @@ class TestMultipleObserversReceiveEvents:
         assert metrics['requests_completed'] == 1
 
 
+@pytest.mark.integration
 class TestEventBusHistory:
     """Test EventBus history and query functionality."""
 
+    def test_fixture_bus_is_singleton(self, event_bus):
+        """Test that services publishing via EventBus() reach the fixture's bus."""
+        assert EventBus() is event_bus
+
     def test_event_history_recorded(self, event_bus):
         """Test that events are recorded in history."""
         event_bus.publish(EventTypes.REQUEST_CREATED, {'request_id': 1})
@@ -362,6 +364,7 @@ class TestEventBusHistory:
         assert all(e.source == 'ServiceA' for e in service_a_history)
 
 
+@pytest.mark.integration
 class TestObserverIndependence:
     """Test that observer failures don't affect others."""
 
@@ -16,7 +16,8 @@ import pytest
 class TestListUsers:
     """Test list users endpoint."""
 
-    def test_list_users_returns_all_users(self, client, db_session, admin_token, multiple_users):
+    def test_list_users_returns_all_users(self, client, db_session, admin_token,
+                                          multiple_users_readonly):
         """Test listing users returns all users."""
         response = client.get('/api/v1/users',
                               headers={'Authorization': f'Bearer {admin_token}'})
@@ -26,10 +27,11 @@ class TestListUsers:
         assert 'data' in data
         assert 'total' in data
         # admin_token creates sample_admin, so total is multiple_users + 1
-        assert data['total'] == len(multiple_users) + 1
-        assert len(data['data']) == len(multiple_users) + 1
+        assert data['total'] == len(multiple_users_readonly) + 1
+        assert len(data['data']) == len(multiple_users_readonly) + 1
 
-    def test_list_users_includes_all_roles(self, client, db_session, admin_token, multiple_users):
+    def test_list_users_includes_all_roles(self, client, db_session, admin_token,
+                                           multiple_users_readonly):
         """Test listing users includes all roles."""
         response = client.get('/api/v1/users',
                               headers={'Authorization': f'Bearer {admin_token}'})
@@ -175,12 +177,9 @@ class TestChangePassword:
         data = response.get_json()
         assert 'message' in data
 
-        # Verify can login with new password
-        login_response = client.post('/api/v1/auth/login', json={
-            'email': sample_user.email,
-            'password': 'NewSecurePass456!'
-        })
-        assert login_response.status_code == 200
+        # Verify the stored hash now matches the new password
+        db_session.session.refresh(sample_user)
+        assert sample_user.check_password('NewSecurePass456!')
 
     def test_change_password_wrong_old_password(self, client, db_session, sample_user, client_token):
         """Test password change fails with wrong old password."""
@@ -235,7 +234,7 @@ class TestListTechnicians:
     """Test list technicians endpoint."""
 
     def test_list_technicians_returns_only_technicians(self, client, db_session, client_token,
-                                                       multiple_users):
+                                                       multiple_users_readonly):
         """Test list technicians returns only technician role users."""
         response = client.get('/api/v1/users/technicians',
                               headers={'Authorization': f'Bearer {client_token}'})
@@ -248,8 +247,8 @@ class TestListTechnicians:
         for user in data['data']:
             assert user['role'] == 'technician'
 
-        # Count technicians in fixture (3 technicians created in multiple_users)
-        expected_count = sum(1 for u in multiple_users if u.role.value == 'technician')
+        # Count technicians in fixture (3 technicians created in multiple_users_readonly)
+        expected_count = sum(1 for u in multiple_users_readonly if u.role.value == 'technician')
         assert len(data['data']) == expected_count
 
     def test_list_technicians_excludes_inactive(self, client, db_session, client_token,
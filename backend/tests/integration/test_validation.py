@@ -17,56 +17,52 @@ import pytest
 class TestEmailValidation:
     """Test email validation."""
 
-    def test_register_invalid_email_format(self, client, db_session):
+    @pytest.mark.parametrize('email', [
+        'notanemail',
+        '@nodomain.com',
+        'missing@domain',
+        'spaces in@email.com',
+        'double@@email.com'
+    ])
+    def test_register_invalid_email_format(self, client, db_session, email):
         """Test registration rejects invalid email formats."""
-        invalid_emails = [
-            'notanemail',
-            '@nodomain.com',
-            'missing@domain',
-            'spaces in@email.com',
-            'double@@email.com'
-        ]
-
-        for email in invalid_emails:
-            response = client.post('/api/v1/auth/register', json={
-                'email': email,
-                'password': 'ValidPass123!',
-                'first_name': 'Test',
-                'last_name': 'User',
-                'role': 'client'
-            })
-
-            assert response.status_code == 400
-            data = response.get_json()
-            assert 'error' in data
-            assert data['error']['code'] == 'VALIDATION_ERROR'
+        response = client.post('/api/v1/auth/register', json={
+            'email': email,
+            'password': 'ValidPass123!',
+            'first_name': 'Test',
+            'last_name': 'User',
+            'role': 'client'
+        })
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert 'error' in data
+        assert data['error']['code'] == 'VALIDATION_ERROR'
 
 
 @pytest.mark.integration
 class TestPasswordValidation:
     """Test password validation."""
 
-    def test_register_weak_passwords(self, client, db_session):
+    @pytest.mark.parametrize('password', [
+        'short',  # Too short
+        '1234567',  # Only numbers, too short
+        'pass',  # Too short
+        ''  # Empty
+    ])
+    def test_register_weak_passwords(self, client, db_session, password):
         """Test registration rejects weak passwords."""
-        weak_passwords = [
-            'short',  # Too short
-            '1234567',  # Only numbers, too short
-            'pass',  # Too short
-            ''  # Empty
-        ]
-
-        for password in weak_passwords:
-            response = client.post('/api/v1/auth/register', json={
-                'email': f'test{password}@example.com',
-                'password': password,
-                'first_name': 'Test',
-                'last_name': 'User',
-                'role': 'client'
-            })
-
-            assert response.status_code == 400
-            data = response.get_json()
-            assert 'error' in data
+        response = client.post('/api/v1/auth/register', json={
+            'email': f'test{password}@example.com',
+            'password': password,
+            'first_name': 'Test',
+            'last_name': 'User',
+            'role': 'client'
+        })
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert 'error' in data
 
     def test_change_password_validates_new_password(self, client, db_session, sample_user,
                                                     client_token):
@@ -88,23 +84,21 @@ class TestPasswordValidation:
 class TestEnumValidation:
     """Test enum field validation."""
 
-    def test_register_invalid_role(self, client, db_session):
+    @pytest.mark.parametrize('role', ['superadmin', 'user', 'manager', 'invalid'])
+    def test_register_invalid_role(self, client, db_session, role):
         """Test registration rejects invalid roles."""
-        invalid_roles = ['superadmin', 'user', 'manager', 'invalid']
-
-        for role in invalid_roles:
-            response = client.post('/api/v1/auth/register', json={
-                'email': f'{role}@example.com',
-                'password': 'ValidPass123!',
-                'first_name': 'Test',
-                'last_name': 'User',
-                'role': role
-            })
-
-            assert response.status_code == 400
-            data = response.get_json()
-            assert 'error' in data
-            assert data['error']['code'] == 'VALIDATION_ERROR'
+        response = client.post('/api/v1/auth/register', json={
+            'email': f'{role}@example.com',
+            'password': 'ValidPass123!',
+            'first_name': 'Test',
+            'last_name': 'User',
+            'role': role
+        })
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert 'error' in data
+        assert data['error']['code'] == 'VALIDATION_ERROR'
 
     def test_create_asset_invalid_category(self, client, db_session, admin_token):
         """Test asset creation rejects invalid categories."""
@@ -123,125 +117,120 @@ class TestEnumValidation:
         data = response.get_json()
         assert 'error' in data
 
-    def test_update_asset_condition_invalid_value(self, client, db_session, technician_token,
-                                                  sample_asset):
+    @pytest.mark.parametrize('condition', ['broken', 'new', 'old', 'invalid'])
+    def test_update_asset_condition_invalid_value(self, client, db_session, module_technician_token,
+                                                  module_asset, condition):
         """Test asset condition update rejects invalid conditions."""
-        invalid_conditions = ['broken', 'new', 'old', 'invalid']
+        response = client.patch(f'/api/v1/assets/{module_asset.id}/condition',
+                                headers={'Authorization': f'Bearer {module_technician_token}'},
+                                json={'condition': condition})
 
-        for condition in invalid_conditions:
-            response = client.patch(f'/api/v1/assets/{sample_asset.id}/condition',
-                                    headers={'Authorization': f'Bearer {technician_token}'},
-                                    json={'condition': condition})
-
-            assert response.status_code == 400
+        assert response.status_code == 400
 
-    def test_create_request_invalid_type(self, client, db_session, client_token, sample_asset):
+    @pytest.mark.parametrize('req_type', ['carpentry', 'painting', 'landscaping', 'invalid'])
+    def test_create_request_invalid_type(self, client, db_session, client_token, module_asset,
+                                         req_type):
         """Test request creation rejects invalid types."""
-        invalid_types = ['carpentry', 'painting', 'landscaping', 'invalid']
-
-        for req_type in invalid_types:
-            response = client.post('/api/v1/requests',
-                                   headers={'Authorization': f'Bearer {client_token}'},
-                                   json={
-                                       'request_type': req_type,
-                                       'asset_id': sample_asset.id,
-                                       'title': 'Test Request',
-                                       'description': 'Test description'
-                                   })
+        response = client.post('/api/v1/requests',
+                               headers={'Authorization': f'Bearer {client_token}'},
+                               json={
+                                   'request_type': req_type,
+                                   'asset_id': module_asset.id,
+                                   'title': 'Test Request',
+                                   'description': 'Test description'
+                               })
 
-            assert response.status_code == 400
+        assert response.status_code == 400
 
-    def test_create_request_invalid_priority(self, client, db_session, client_token, sample_asset):
+    @pytest.mark.parametrize('priority', ['critical', 'minor', 'normal', 'invalid'])
+    def test_create_request_invalid_priority(self, client, db_session, client_token, module_asset,
+                                             priority):
         """Test request creation rejects invalid priorities."""
-        invalid_priorities = ['critical', 'minor', 'normal', 'invalid']
-
-        for priority in invalid_priorities:
-            response = client.post('/api/v1/requests',
-                                   headers={'Authorization': f'Bearer {client_token}'},
-                                   json={
-                                       'request_type': 'electrical',
-                                       'asset_id': sample_asset.id,
-                                       'title': 'Test Request',
-                                       'description': 'Test description',
-                                       'priority': priority
-                                   })
+        response = client.post('/api/v1/requests',
+                               headers={'Authorization': f'Bearer {client_token}'},
+                               json={
+                                   'request_type': 'electrical',
+                                   'asset_id': module_asset.id,
+                                   'title': 'Test Request',
+                                   'description': 'Test description',
+                                   'priority': priority
+                               })
 
-            assert response.status_code == 400
+        assert response.status_code == 400
 
 
 @pytest.mark.integration
 class TestRequiredFieldValidation:
     """Test required field validation."""
 
-    def test_register_missing_fields(self, client, db_session):
+    @pytest.mark.parametrize('missing', ['email', 'password', 'first_name', 'last_name', 'role'])
+    def test_register_missing_fields(self, client, db_session, missing):
         """Test registration requires all fields."""
-        test_cases = [
-            {'password': 'Pass123!', 'first_name': 'Test', 'last_name': 'User', 'role': 'client'},
-            {'email': 'test@example.com', 'first_name': 'Test', 'last_name': 'User', 'role': 'client'},
-            {'email': 'test@example.com', 'password': 'Pass123!', 'last_name': 'User', 'role': 'client'},
-            {'email': 'test@example.com', 'password': 'Pass123!', 'first_name': 'Test', 'role': 'client'},
-            {'email': 'test@example.com', 'password': 'Pass123!', 'first_name': 'Test', 'last_name': 'User'}
-        ]
-
-        for data in test_cases:
-            response = client.post('/api/v1/auth/register', json=data)
-            assert response.status_code == 400
-            result = response.get_json()
-            assert 'error' in result
-            assert result['error']['code'] == 'VALIDATION_ERROR'
-
-    def test_login_missing_fields(self, client, db_session):
-        """Test login requires email and password."""
-        test_cases = [
-            {'email': 'test@example.com'},
-            {'password': 'password123'},
-            {}
-        ]
+        data = {
+            'email': 'test@example.com',
+            'password': 'Pass123!',
+            'first_name': 'Test',
+            'last_name': 'User',
+            'role': 'client'
+        }
+        del data[missing]
 
-        for data in test_cases:
-            response = client.post('/api/v1/auth/login', json=data)
-            assert response.status_code == 400
+        response = client.post('/api/v1/auth/register', json=data)
+        assert response.status_code == 400
+        result = response.get_json()
+        assert 'error' in result
+        assert result['error']['code'] == 'VALIDATION_ERROR'
+
+    @pytest.mark.parametrize('data', [
+        {'email': 'test@example.com'},
+        {'password': 'password123'},
+        {}
+    ])
+    def test_login_missing_fields(self, client, db_session, data):
+        """Test login requires email and password."""
+        response = client.post('/api/v1/auth/login', json=data)
+        assert response.status_code == 400
 
-    def test_create_asset_missing_fields(self, client, db_session, admin_token):
+    # Only name, asset_tag, and category are required per schema
+    @pytest.mark.parametrize('data', [
+        {'asset_tag': 'TEST-001', 'category': 'electrical'},  # Missing name
+        {'name': 'Test', 'category': 'electrical'},  # Missing asset_tag
+        {'name': 'Test', 'asset_tag': 'TEST-001'},  # Missing category
+    ])
+    def test_create_asset_missing_fields(self, client, db_session, admin_token, data):
         """Test asset creation requires all mandatory fields."""
-        # Only name, asset_tag, and category are required per schema
-        test_cases = [
-            {'asset_tag': 'TEST-001', 'category': 'electrical'},  # Missing name
-            {'name': 'Test', 'category': 'electrical'},  # Missing asset_tag
-            {'name': 'Test', 'asset_tag': 'TEST-001'},  # Missing category
-        ]
-
-        for data in test_cases:
-            response = client.post('/api/v1/assets',
-                                   headers={'Authorization': f'Bearer {admin_token}'},
-                                   json=data)
-            assert response.status_code == 400
-
-    def test_create_request_missing_fields(self, client, db_session, client_token, sample_asset):
+        response = client.post('/api/v1/assets',
+                               headers={'Authorization': f'Bearer {admin_token}'},
+                               json=data)
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize('missing', ['request_type', 'asset_id', 'title', 'description'])
+    def test_create_request_missing_fields(self, client, db_session, client_token, module_asset,
+                                           missing):
         """Test request creation requires all mandatory fields."""
-        test_cases = [
-            {'asset_id': sample_asset.id, 'title': 'Test', 'description': 'Desc'},
-            {'request_type': 'electrical', 'title': 'Test', 'description': 'Desc'},
-            {'request_type': 'electrical', 'asset_id': sample_asset.id, 'description': 'Desc'},
-            {'request_type': 'electrical', 'asset_id': sample_asset.id, 'title': 'Test'}
-        ]
-
-        for data in test_cases:
-            response = client.post('/api/v1/requests',
-                                   headers={'Authorization': f'Bearer {client_token}'},
-                                   json=data)
-            assert response.status_code == 400
+        data = {
+            'request_type': 'electrical',
+            'asset_id': module_asset.id,
+            'title': 'Test',
+            'description': 'Desc'
+        }
+        del data[missing]
+
+        response = client.post('/api/v1/requests',
+                               headers={'Authorization': f'Bearer {client_token}'},
+                               json=data)
+        assert response.status_code == 400
 
     def test_complete_request_missing_notes(self, client, db_session, admin_token,
-                                           technician_token, client_token, sample_technician,
-                                           sample_asset):
+                                           module_technician_token, client_token, module_technician,
+                                           module_asset):
         """Test request completion requires completion notes."""
         # Create, assign, and start request
         create_response = client.post('/api/v1/requests',
                                       headers={'Authorization': f'Bearer {client_token}'},
                                       json={
                                           'request_type': 'electrical',
-                                          'asset_id': sample_asset.id,
+                                          'asset_id': module_asset.id,
                                           'title': 'Test Request',
                                           'description': 'Test description',
                                           'priority': 'medium',
@@ -253,14 +242,14 @@ class TestRequiredFieldValidation:
 
         client.post(f'/api/v1/requests/{request_id}/assign',
                    headers={'Authorization': f'Bearer {admin_token}'},
-                   json={'technician_id': sample_technician.id})
+                   json={'technician_id': module_technician.id})
 
         client.post(f'/api/v1/requests/{request_id}/start',
-                   headers={'Authorization': f'Bearer {technician_token}'})
+                   headers={'Authorization': f'Bearer {module_technician_token}'})
 
         # Try to complete without notes
         response = client.post(f'/api/v1/requests/{request_id}/complete',
-                               headers={'Authorization': f'Bearer {technician_token}'},
+                               headers={'Authorization': f'Bearer {module_technician_token}'},
                                json={})
 
         assert response.status_code == 400
@@ -292,14 +281,14 @@ class TestLengthConstraints:
         })
         # May pass or fail depending on validation rules
 
-    def test_create_request_title_length(self, client, db_session, client_token, sample_asset):
+    def test_create_request_title_length(self, client, db_session, client_token, module_asset):
         """Test request title length constraints."""
         # Test with empty title
         response = client.post('/api/v1/requests',
                                headers={'Authorization': f'Bearer {client_token}'},
                                json={
                                    'request_type': 'electrical',
-                                   'asset_id': sample_asset.id,
+                                   'asset_id': module_asset.id,
                                    'title': '',
                                    'description': 'Test description'
                                })
@@ -310,7 +299,7 @@ class TestLengthConstraints:
                                headers={'Authorization': f'Bearer {client_token}'},
                                json={
                                    'request_type': 'electrical',
-                                   'asset_id': sample_asset.id,
+                                   'asset_id': module_asset.id,
                                    'title': 'T' * 500,  # Very long
                                    'description': 'Test description'
                                })
@@ -321,7 +310,7 @@ class TestLengthConstraints:
 class TestTypeValidation:
     """Test data type validation."""
 
-    def test_asset_id_must_be_integer(self, client, db_session, client_token, sample_asset):
+    def test_asset_id_must_be_integer(self, client, db_session, client_token, module_asset):
         """Test asset_id must be an integer."""
         response = client.post('/api/v1/requests',
                                headers={'Authorization': f'Bearer {client_token}'},
@@ -335,14 +324,14 @@ class TestTypeValidation:
         assert response.status_code == 400
 
     def test_technician_id_must_be_integer(self, client, db_session, admin_token, client_token,
-                                           sample_asset):
+                                           module_asset):
         """Test technician_id must be an integer."""
         # Create request
         create_response = client.post('/api/v1/requests',
                                       headers={'Authorization': f'Bearer {client_token}'},
                                       json={
                                           'request_type': 'electrical',
-                                          'asset_id': sample_asset.id,
+                                          'asset_id': module_asset.id,
                                           'title': 'Test Request',
                                           'description': 'Test description',
                                           'priority': 'medium',
@@ -9,6 +9,27 @@ from app.repositories.asset_repository import AssetRepository
 from app.models import Asset, AssetCategory, AssetStatus, AssetCondition
 
 
+@pytest.fixture(scope='module')
+def assets_snapshot(multiple_assets_readonly):
+    """
+    Ids of the shared assets grouped by each attribute the repository
+    filters on, built in Python from the fixture rows.
+
+    Returns:
+        Dict of attribute name -> {attribute value: set of asset ids}
+    """
+    snapshot = {'category': {}, 'status': {}, 'condition': {}, 'floor': {}}
+    for asset in multiple_assets_readonly:
+        for attr, groups in snapshot.items():
+            groups.setdefault(getattr(asset, attr), set()).add(asset.id)
+    return snapshot
+
+
+def ids(assets):
+    """Set of ids for a list of assets."""
+    return {asset.id for asset in assets}
+
+
 class TestAssetRepository:
     """Test suite for AssetRepository"""
 
@@ -59,83 +80,64 @@ class TestAssetRepository:
         assert self.repo.asset_tag_exists(sample_asset.asset_tag) is True
         assert self.repo.asset_tag_exists('NONEXISTENT') is False
 
-    def test_get_by_category(self, db_session, multiple_assets):
+    @pytest.mark.parametrize('category', [
+        AssetCategory.ELECTRICAL, AssetCategory.PLUMBING, AssetCategory.HVAC
+    ])
+    def test_get_by_category(self, db_session, assets_snapshot, category):
         """Test retrieving assets by category"""
-        electrical = self.repo.get_by_category(AssetCategory.ELECTRICAL)
-        plumbing = self.repo.get_by_category(AssetCategory.PLUMBING)
-        hvac = self.repo.get_by_category(AssetCategory.HVAC)
-
-        # With 10 assets cycling through 3 categories
-        assert len(electrical) >= 3
-        assert len(plumbing) >= 3
-        assert len(hvac) >= 3
+        assert ids(self.repo.get_by_category(category)) == assets_snapshot['category'][category]
 
-        assert all(a.category == AssetCategory.ELECTRICAL for a in electrical)
-        assert all(a.category == AssetCategory.PLUMBING for a in plumbing)
-        assert all(a.category == AssetCategory.HVAC for a in hvac)
-
-    def test_get_by_status(self, db_session, multiple_assets):
+    @pytest.mark.parametrize('status', [AssetStatus.ACTIVE, AssetStatus.IN_REPAIR])
+    def test_get_by_status(self, db_session, assets_snapshot, status):
         """Test retrieving assets by status"""
-        active = self.repo.get_by_status(AssetStatus.ACTIVE)
-        in_repair = self.repo.get_by_status(AssetStatus.IN_REPAIR)
-
-        assert len(active) > 0
-        assert len(in_repair) > 0
-        assert all(a.status == AssetStatus.ACTIVE for a in active)
-        assert all(a.status == AssetStatus.IN_REPAIR for a in in_repair)
+        assert ids(self.repo.get_by_status(status)) == assets_snapshot['status'][status]
 
-    def test_get_by_condition(self, db_session, multiple_assets):
+    @pytest.mark.parametrize('condition', [AssetCondition.EXCELLENT, AssetCondition.POOR])
+    def test_get_by_condition(self, db_session, assets_snapshot, condition):
         """Test retrieving assets by condition"""
-        excellent = self.repo.get_by_condition(AssetCondition.EXCELLENT)
-        poor = self.repo.get_by_condition(AssetCondition.POOR)
+        assert ids(self.repo.get_by_condition(condition)) == assets_snapshot['condition'][condition]
 
-        assert len(excellent) > 0
-        assert len(poor) > 0
-        assert all(a.condition == AssetCondition.EXCELLENT for a in excellent)
-        assert all(a.condition == AssetCondition.POOR for a in poor)
-
-    def test_get_by_location(self, db_session, multiple_assets):
+    def test_get_by_location(self, db_session, multiple_assets_readonly, assets_snapshot):
         """Test retrieving assets by location"""
         # All test assets are in Building A
         building_assets = self.repo.get_by_location(building='Building A')
-        assert len(building_assets) == len(multiple_assets)
+        assert ids(building_assets) == ids(multiple_assets_readonly)
 
         # Floor 1 assets
         floor1_assets = self.repo.get_by_location(building='Building A', floor='1')
-        assert len(floor1_assets) > 0
-        assert all(a.floor == '1' for a in floor1_assets)
+        assert ids(floor1_assets) == assets_snapshot['floor']['1']
 
-    def test_get_operational_assets(self, db_session, multiple_assets):
+    def test_get_operational_assets(self, db_session, assets_snapshot):
         """Test retrieving operational (active) assets"""
         operational = self.repo.get_operational_assets()
 
-        assert all(a.status == AssetStatus.ACTIVE for a in operational)
+        assert ids(operational) == assets_snapshot['status'][AssetStatus.ACTIVE]
         assert all(a.is_operational for a in operational)
 
-    def test_get_assets_needing_maintenance(self, db_session, multiple_assets):
+    def test_get_assets_needing_maintenance(self, db_session, assets_snapshot):
         """Test retrieving assets in poor or critical condition"""
         needing_maintenance = self.repo.get_assets_needing_maintenance()
 
-        assert all(
-            a.condition in [AssetCondition.POOR, AssetCondition.CRITICAL]
-            for a in needing_maintenance
-        )
+        by_condition = assets_snapshot['condition']
+        expected = (by_condition.get(AssetCondition.POOR, set())
+                    | by_condition.get(AssetCondition.CRITICAL, set()))
+        assert ids(needing_maintenance) == expected
         assert all(a.needs_maintenance for a in needing_maintenance)
 
-    def test_get_assets_under_repair(self, db_session, multiple_assets):
+    def test_get_assets_under_repair(self, db_session, assets_snapshot):
         """Test retrieving assets under repair"""
         under_repair = self.repo.get_assets_under_repair()
 
-        assert all(a.status == AssetStatus.IN_REPAIR for a in under_repair)
+        assert ids(under_repair) == assets_snapshot['status'][AssetStatus.IN_REPAIR]
 
-    def test_search_assets(self, db_session, multiple_assets):
+    def test_search_assets(self, db_session, multiple_assets_readonly):
         """Test searching assets by name/description/tag"""
         # Search by name
         results = self.repo.search_assets('Asset 1')
         assert len(results) > 0
 
         # Search by tag
-        results = self.repo.search_assets('ASSET-001')
+        results = self.repo.search_assets(multiple_assets_readonly[1].asset_tag)
         assert len(results) == 1
 
     def test_mark_asset_under_repair(self, db_session, sample_asset):
@@ -145,7 +147,8 @@ class TestAssetRepository:
         result = self.repo.mark_asset_under_repair(sample_asset.id)
 
         assert result is True
-        db_session.session.refresh(sample_asset)
+        # The repository loads the same identity-mapped instance, and the
+        # session doesn't expire on commit, so no reload is needed
         assert sample_asset.status == AssetStatus.IN_REPAIR
 
     def test_mark_retired_asset_under_repair_fails(self, db_session, sample_asset):
@@ -164,7 +167,6 @@ class TestAssetRepository:
         result = self.repo.mark_asset_repaired(sample_asset.id, AssetCondition.EXCELLENT)
 
         assert result is True
-        db_session.session.refresh(sample_asset)
         assert sample_asset.status == AssetStatus.ACTIVE
         assert sample_asset.condition == AssetCondition.EXCELLENT
 
@@ -175,7 +177,6 @@ class TestAssetRepository:
         result = self.repo.update_asset_condition(sample_asset.id, AssetCondition.POOR)
 
         assert result is True
-        db_session.session.refresh(sample_asset)
         assert sample_asset.condition == AssetCondition.POOR
 
     def test_retire_asset(self, db_session, sample_asset):
@@ -183,7 +184,6 @@ class TestAssetRepository:
         result = self.repo.retire_asset(sample_asset.id)
 
         assert result is True
-        db_session.session.refresh(sample_asset)
         assert sample_asset.status == AssetStatus.RETIRED
 
     def test_asset_full_location_property(self, db_session, sample_asset):
@@ -212,18 +212,32 @@ class TestAssetRepository:
         sample_asset.mark_repaired()
         assert sample_asset.is_operational is True
 
-    def test_get_asset_statistics(self, db_session, multiple_assets):
+    def test_get_asset_statistics(self, db_session, multiple_assets_readonly):
         """Test asset statistics aggregation"""
         stats = self.repo.get_asset_statistics()
 
-        assert stats['total'] == len(multiple_assets)
-        assert 'by_status' in stats
-        assert 'by_condition' in stats
-        assert 'needs_maintenance' in stats
-
-        # Verify counts add up
-        status_total = sum(stats['by_status'].values())
-        assert status_total == stats['total']
+        # multiple_assets_readonly cycles statuses over i % 3 and conditions over i % 4
+        assert stats == {
+            'total_assets': len(multiple_assets_readonly),
+            'by_status': {
+                AssetStatus.ACTIVE.value: 4,
+                AssetStatus.IN_REPAIR.value: 3,
+                AssetStatus.OUT_OF_SERVICE.value: 3,
+                AssetStatus.RETIRED.value: 0,
+            },
+            'by_condition': {
+                AssetCondition.EXCELLENT.value: 3,
+                AssetCondition.GOOD.value: 3,
+                AssetCondition.FAIR.value: 2,
+                AssetCondition.POOR.value: 2,
+                AssetCondition.CRITICAL.value: 0,
+            },
+            'needs_maintenance': 2,
+        }
+        assert stats['needs_maintenance'] == (
+            stats['by_condition'][AssetCondition.POOR.value]
+            + stats['by_condition'][AssetCondition.CRITICAL.value]
+        )
 
     def test_asset_to_dict(self, db_session, sample_asset):
         """Test asset serialization to dictionary"""
@@ -238,10 +252,10 @@ class TestAssetRepository:
         assert 'needs_maintenance' in data
         assert 'is_operational' in data
 
-    def test_count_assets(self, db_session, multiple_assets):
+    def test_count_assets(self, db_session, multiple_assets_readonly):
         """Test counting assets"""
         total = self.repo.count()
-        assert total == len(multiple_assets)
+        assert total == len(multiple_assets_readonly)
 
         active_count = self.repo.count(status=AssetStatus.ACTIVE)
         assert active_count > 0
@@ -254,3 +268,18 @@ class TestAssetRepository:
 
         assert result is True
         assert self.repo.get_by_id(asset_id) is None
+
+    @pytest.mark.parametrize('column,value,index_name', [
+        (Asset.category, AssetCategory.ELECTRICAL, 'ix_assets_category'),
+        (Asset.status, AssetStatus.ACTIVE, 'ix_assets_status'),
+        (Asset.condition, AssetCondition.POOR, 'ix_assets_condition'),
+        (Asset.building, 'Building A', 'ix_assets_building_floor'),
+    ])
+    def test_filters_use_index(self, db_session, column, value, index_name):
+        """Test the filter columns are indexed rather than scanned"""
+        query = db_session.select(Asset).where(column == value)
+        sql = str(query.compile(db_session.engine, compile_kwargs={'literal_binds': True}))
+
+        plan = db_session.session.execute(db_session.text(f'EXPLAIN QUERY PLAN {sql}')).all()
+
+        assert any(index_name in row[-1] for row in plan)
@@ -9,32 +9,50 @@ Tests:
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 from app.services.asset_service import AssetService
-from app.models import AssetCondition, AssetStatus
+from app.models import AssetCondition
+
+
+def fake_asset(data=None, **attrs):
+    """
+    Plain stand-in for an Asset row.
+
+    Only the repository needs call tracking, so assets are simple
+    namespaces whose to_dict() returns ``data``.
+    """
+    return SimpleNamespace(to_dict=lambda: data, **attrs)
+
+
+@pytest.fixture
+def asset_repo():
+    """Stand-in AssetRepository; each test configures the calls it needs."""
+    return Mock()
+
+
+@pytest.fixture
+def service(asset_repo):
+    """AssetService wired to the mock repository."""
+    return AssetService(asset_repo)
 
 
 class TestGetAssetsNeedingMaintenance:
     """Test retrieval of assets needing maintenance."""
 
-    def test_get_assets_needing_maintenance_success(self):
+    def test_get_assets_needing_maintenance_success(self, asset_repo, service):
         """Test successful retrieval of assets needing maintenance."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
-        mock_asset1 = Mock()
-        mock_asset1.to_dict.return_value = {
+        mock_asset1 = fake_asset({
             'id': 1,
             'name': 'Server A',
             'condition': 'poor'
-        }
+        })
 
-        mock_asset2 = Mock()
-        mock_asset2.to_dict.return_value = {
+        mock_asset2 = fake_asset({
             'id': 2,
             'name': 'Server B',
             'condition': 'critical'
-        }
+        })
 
         asset_repo.get_assets_needing_maintenance.return_value = [mock_asset1, mock_asset2]
 
@@ -45,26 +63,20 @@ class TestGetAssetsNeedingMaintenance:
         assert 'Found 2 assets needing maintenance' in result['message']
         asset_repo.get_assets_needing_maintenance.assert_called_once()
 
-    def test_get_assets_needing_maintenance_empty(self):
+    def test_get_assets_needing_maintenance_empty(self, asset_repo, service):
         """Test when no assets need maintenance."""
-        asset_repo = Mock()
         asset_repo.get_assets_needing_maintenance.return_value = []
 
-        service = AssetService(asset_repo)
-
         result = service.get_assets_needing_maintenance()
 
         assert result['success'] is True
         assert len(result['data']) == 0
         assert 'Found 0 assets needing maintenance' in result['message']
 
-    def test_get_assets_needing_maintenance_exception(self):
+    def test_get_assets_needing_maintenance_exception(self, asset_repo, service):
         """Test exception handling."""
-        asset_repo = Mock()
         asset_repo.get_assets_needing_maintenance.side_effect = Exception('Database error')
 
-        service = AssetService(asset_repo)
-
         result = service.get_assets_needing_maintenance()
 
         assert result['success'] is False
@@ -74,25 +86,16 @@ class TestGetAssetsNeedingMaintenance:
 class TestUpdateAssetCondition:
     """Test asset condition update functionality."""
 
-    def test_update_asset_condition_success(self):
+    def test_update_asset_condition_success(self, asset_repo, service):
         """Test successful asset condition update."""
-        from app.models import AssetCondition
-
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = True
 
         # Mock the asset returned by get_by_id
-        mock_asset_before = Mock()
-        mock_asset_before.condition = AssetCondition.GOOD
-        mock_asset_before.name = "Test Asset"
-
-        mock_asset_after = Mock()
-        mock_asset_after.to_dict.return_value = {'asset_id': 1, 'condition': 'poor', 'name': 'Test Asset'}
+        mock_asset_before = fake_asset(condition=AssetCondition.GOOD, name="Test Asset")
+        mock_asset_after = fake_asset({'asset_id': 1, 'condition': 'poor', 'name': 'Test Asset'})
 
         asset_repo.get_by_id.side_effect = [mock_asset_before, mock_asset_after]
 
-        service = AssetService(asset_repo)
-
         result = service.update_asset_condition(
             asset_id=1,
             new_condition='poor'
@@ -104,59 +107,40 @@ class TestUpdateAssetCondition:
         assert 'Asset condition updated' in result['message']
         asset_repo.update_asset_condition.assert_called_once()
 
-    def test_update_asset_condition_all_valid_conditions(self):
+    @pytest.mark.parametrize('condition', ['excellent', 'good', 'fair', 'poor', 'critical'])
+    def test_update_asset_condition_all_valid_conditions(self, asset_repo, service, condition):
         """Test update with all valid condition values."""
-        from app.models import AssetCondition
-
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = True
 
-        service = AssetService(asset_repo)
+        mock_asset_before = fake_asset(condition=AssetCondition.GOOD, name="Test Asset")
+        mock_asset_after = fake_asset({'asset_id': 1, 'condition': condition})
 
-        valid_conditions = ['excellent', 'good', 'fair', 'poor', 'critical']
-
-        for condition in valid_conditions:
-            # Mock asset for each iteration
-            mock_asset_before = Mock()
-            mock_asset_before.condition = AssetCondition.GOOD
-            mock_asset_before.name = "Test Asset"
-
-            mock_asset_after = Mock()
-            mock_asset_after.to_dict.return_value = {'asset_id': 1, 'condition': condition}
-
-            asset_repo.get_by_id.side_effect = [mock_asset_before, mock_asset_after]
+        asset_repo.get_by_id.side_effect = [mock_asset_before, mock_asset_after]
 
-            result = service.update_asset_condition(
-                asset_id=1,
-                new_condition=condition
-            )
-            assert result['success'] is True
-            assert result['data']['condition'] == condition
+        result = service.update_asset_condition(
+            asset_id=1,
+            new_condition=condition
+        )
+        assert result['success'] is True
+        assert result['data']['condition'] == condition
 
-    def test_update_asset_condition_case_insensitive(self):
+    @pytest.mark.parametrize('condition_input', ['poor', 'POOR', 'Poor', 'PoOr'])
+    def test_update_asset_condition_case_insensitive(self, asset_repo, service, condition_input):
         """Test condition update handles different cases."""
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = True
 
-        service = AssetService(asset_repo)
-
-        # Test various cases
-        for condition_input in ['poor', 'POOR', 'Poor', 'PoOr']:
-            result = service.update_asset_condition(
-                asset_id=1,
-                new_condition=condition_input
-            )
-            assert result['success'] is True
+        result = service.update_asset_condition(
+            asset_id=1,
+            new_condition=condition_input
+        )
+        assert result['success'] is True
 
-            # Verify enum was passed to repository
-            call_args = asset_repo.update_asset_condition.call_args[0]
-            assert call_args[1] == AssetCondition.POOR
+        # Verify enum was passed to repository
+        call_args = asset_repo.update_asset_condition.call_args[0]
+        assert call_args[1] == AssetCondition.POOR
 
-    def test_update_asset_condition_invalid_condition(self):
+    def test_update_asset_condition_invalid_condition(self, asset_repo, service):
         """Test update fails with invalid condition."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
         result = service.update_asset_condition(
             asset_id=1,
             new_condition='invalid_condition'
@@ -166,13 +150,10 @@ class TestUpdateAssetCondition:
         assert 'Invalid condition' in result['error']
         asset_repo.update_asset_condition.assert_not_called()
 
-    def test_update_asset_condition_asset_not_found(self):
+    def test_update_asset_condition_asset_not_found(self, asset_repo, service):
         """Test update fails when asset doesn't exist."""
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = False
 
-        service = AssetService(asset_repo)
-
         result = service.update_asset_condition(
             asset_id=999,
             new_condition='poor'
@@ -181,11 +162,8 @@ class TestUpdateAssetCondition:
         assert result['success'] is False
         assert 'Asset not found' in result['error']
 
-    def test_update_asset_condition_validation_errors(self):
+    def test_update_asset_condition_validation_errors(self, service):
         """Test validation of required fields."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
         # Invalid asset_id (0 or negative)
         result = service.update_asset_condition(
             asset_id=0,
@@ -199,13 +177,10 @@ class TestUpdateAssetCondition:
         )
         assert result['success'] is False
 
-    def test_update_asset_condition_triggers_business_logic(self):
+    def test_update_asset_condition_triggers_business_logic(self, asset_repo, service):
         """Test business rule: poor/critical conditions flag for maintenance."""
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = True
 
-        service = AssetService(asset_repo)
-
         # Update to poor condition
         result = service.update_asset_condition(
             asset_id=1,
@@ -219,13 +194,10 @@ class TestUpdateAssetCondition:
         assert call_args[0] == 1
         assert call_args[1] == AssetCondition.POOR
 
-    def test_update_asset_condition_exception_handling(self):
+    def test_update_asset_condition_exception_handling(self, asset_repo, service):
         """Test exception handling during update."""
-        asset_repo = Mock()
         asset_repo.update_asset_condition.side_effect = Exception('Database error')
 
-        service = AssetService(asset_repo)
-
         result = service.update_asset_condition(
             asset_id=1,
             new_condition='poor'
@@ -238,11 +210,8 @@ class TestUpdateAssetCondition:
 class TestGetAssetStatistics:
     """Test asset statistics retrieval."""
 
-    def test_get_asset_statistics_success(self):
+    def test_get_asset_statistics_success(self, asset_repo, service):
         """Test successful statistics retrieval."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
         mock_stats = {
             'total_assets': 50,
             'by_status': {
@@ -272,11 +241,8 @@ class TestGetAssetStatistics:
         assert result['data']['needs_maintenance'] == 8
         asset_repo.get_asset_statistics.assert_called_once()
 
-    def test_get_asset_statistics_empty_database(self):
+    def test_get_asset_statistics_empty_database(self, asset_repo, service):
         """Test statistics with no assets."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
         empty_stats = {
             'total_assets': 0,
             'by_status': {},
@@ -291,13 +257,10 @@ class TestGetAssetStatistics:
         assert result['success'] is True
         assert result['data']['total_assets'] == 0
 
-    def test_get_asset_statistics_exception(self):
+    def test_get_asset_statistics_exception(self, asset_repo, service):
         """Test exception handling."""
-        asset_repo = Mock()
         asset_repo.get_asset_statistics.side_effect = Exception('Database error')
 
-        service = AssetService(asset_repo)
-
         result = service.get_asset_statistics()
 
         assert result['success'] is False
@@ -307,11 +270,8 @@ class TestGetAssetStatistics:
 class TestAssetServiceIntegration:
     """Test service integration and business logic."""
 
-    def test_service_uses_base_service_validation(self):
+    def test_service_uses_base_service_validation(self, service):
         """Test service inherits validation from BaseService."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
         # Test positive number validation (inherited from BaseService)
         result = service.update_asset_condition(
             asset_id=-1,
@@ -321,13 +281,10 @@ class TestAssetServiceIntegration:
         assert result['success'] is False
         # BaseService validation should catch negative ID
 
-    def test_service_uses_base_service_error_responses(self):
+    def test_service_uses_base_service_error_responses(self, asset_repo, service):
         """Test service uses BaseService response format."""
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = True
 
-        service = AssetService(asset_repo)
-
         result = service.update_asset_condition(
             asset_id=1,
             new_condition='poor'
@@ -338,13 +295,10 @@ class TestAssetServiceIntegration:
         assert 'data' in result
         assert 'message' in result
 
-    def test_condition_enum_conversion(self):
+    def test_condition_enum_conversion(self, asset_repo, service):
         """Test proper conversion of condition strings to enums."""
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = True
 
-        service = AssetService(asset_repo)
-
         result = service.update_asset_condition(
             asset_id=1,
             new_condition='poor'
@@ -358,39 +312,17 @@ class TestAssetServiceIntegration:
         assert isinstance(condition_arg, AssetCondition)
         assert condition_arg == AssetCondition.POOR
 
-    def test_repository_abstraction(self):
-        """Test service properly abstracts repository operations."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
-        # Service should delegate to repository for data access
-        service.get_assets_needing_maintenance()
-        asset_repo.get_assets_needing_maintenance.assert_called_once()
-
-        service.get_asset_statistics()
-        asset_repo.get_asset_statistics.assert_called_once()
-
-        service.update_asset_condition(1, 'poor')
-        asset_repo.update_asset_condition.assert_called_once()
-
 
 class TestBusinessRules:
     """Test asset service business rules."""
 
-    def test_poor_and_critical_conditions_flagged_for_maintenance(self):
+    def test_poor_and_critical_conditions_flagged_for_maintenance(self, asset_repo, service):
         """Test business rule: poor/critical assets should be tracked for maintenance."""
-        asset_repo = Mock()
-
-        poor_asset = Mock()
-        poor_asset.to_dict.return_value = {'id': 1, 'condition': 'poor'}
-
-        critical_asset = Mock()
-        critical_asset.to_dict.return_value = {'id': 2, 'condition': 'critical'}
+        poor_asset = fake_asset({'id': 1, 'condition': 'poor'})
+        critical_asset = fake_asset({'id': 2, 'condition': 'critical'})
 
         asset_repo.get_assets_needing_maintenance.return_value = [poor_asset, critical_asset]
 
-        service = AssetService(asset_repo)
-
         result = service.get_assets_needing_maintenance()
 
         assert result['success'] is True
@@ -401,13 +333,10 @@ class TestBusinessRules:
         assert 'poor' in conditions
         assert 'critical' in conditions
 
-    def test_condition_update_logging(self):
+    def test_condition_update_logging(self, asset_repo, service):
         """Test that condition updates are logged."""
-        asset_repo = Mock()
         asset_repo.update_asset_condition.return_value = True
 
-        service = AssetService(asset_repo)
-
         # Update condition
         result = service.update_asset_condition(
             asset_id=1,
@@ -417,11 +346,8 @@ class TestBusinessRules:
         assert result['success'] is True
         # Service should log the action (via BaseService._log_action)
 
-    def test_asset_statistics_provide_actionable_insights(self):
+    def test_asset_statistics_provide_actionable_insights(self, asset_repo, service):
         """Test statistics provide useful business insights."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
         mock_stats = {
             'total_assets': 100,
             'by_status': {
@@ -461,42 +387,37 @@ class TestBusinessRules:
         # 4. Maintenance flagged assets (actionable)
         assert result['data']['needs_maintenance'] == 20
 
-    def test_condition_transition_validates_enum(self):
+    @pytest.mark.parametrize('condition,expected_success', [
+        ('excellent', True),
+        ('good', True),
+        ('fair', True),
+        ('poor', True),
+        ('critical', True),
+        ('broken', False),
+        ('damaged', False),
+        ('ok', False),
+        ('bad', False),
+    ])
+    def test_condition_transition_validates_enum(self, asset_repo, service, condition,
+                                                 expected_success):
         """Test condition transitions are validated through enum."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
-        # Valid conditions should succeed
-        valid_conditions = ['excellent', 'good', 'fair', 'poor', 'critical']
         asset_repo.update_asset_condition.return_value = True
 
-        for condition in valid_conditions:
-            result = service.update_asset_condition(
-                asset_id=1,
-                new_condition=condition
-            )
-            assert result['success'] is True
-
-        # Invalid conditions should fail
-        invalid_conditions = ['broken', 'damaged', 'ok', 'bad']
-
-        for condition in invalid_conditions:
-            result = service.update_asset_condition(
-                asset_id=1,
-                new_condition=condition
-            )
-            assert result['success'] is False
+        result = service.update_asset_condition(
+            asset_id=1,
+            new_condition=condition
+        )
+
+        assert result['success'] is expected_success
+        if not expected_success:
             assert 'Invalid condition' in result['error']
 
 
 class TestServiceLayerPattern:
     """Test Service Layer pattern implementation."""
 
-    def test_service_encapsulates_business_logic(self):
+    def test_service_encapsulates_business_logic(self, asset_repo, service):
         """Test service encapsulates business logic, not just pass-through."""
-        asset_repo = Mock()
-        service = AssetService(asset_repo)
-
         # Service adds business logic on top of repository:
         # 1. Validation (asset_id must be positive)
         result = service.update_asset_condition(
@@ -519,33 +440,30 @@ class TestServiceLayerPattern:
         assert 'data' in result
         assert 'message' in result
 
-    def test_service_handles_repository_failures(self):
+    def test_service_handles_repository_failures(self, asset_repo, service):
         """Test service gracefully handles repository failures."""
-        asset_repo = Mock()
         asset_repo.get_assets_needing_maintenance.side_effect = Exception('DB connection lost')
 
-        service = AssetService(asset_repo)
-
         result = service.get_assets_needing_maintenance()
 
         # Service should catch exception and return error response
         assert result['success'] is False
         assert 'error' in result
 
-    def test_service_provides_consistent_interface(self):
-        """Test all service methods return consistent response format."""
-        asset_repo = Mock()
+    @pytest.mark.parametrize('method,args,repo_method', [
+        ('get_assets_needing_maintenance', (), 'get_assets_needing_maintenance'),
+        ('update_asset_condition', (1, 'poor'), 'update_asset_condition'),
+        ('get_asset_statistics', (), 'get_asset_statistics'),
+    ])
+    def test_service_provides_consistent_interface(self, asset_repo, service, method, args,
+                                                   repo_method):
+        """Test service methods delegate to the repository and share a response format."""
         asset_repo.get_assets_needing_maintenance.return_value = []
         asset_repo.update_asset_condition.return_value = True
         asset_repo.get_asset_statistics.return_value = {'total_assets': 0}
 
-        service = AssetService(asset_repo)
-
-        # All methods should return dict with 'success' key
-        result1 = service.get_assets_needing_maintenance()
-        result2 = service.update_asset_condition(1, 'poor')
-        result3 = service.get_asset_statistics()
+        result = getattr(service, method)(*args)
 
-        for result in [result1, result2, result3]:
-            assert isinstance(result, dict)
-            assert 'success' in result
+        assert isinstance(result, dict)
+        assert 'success' in result
+        getattr(asset_repo, repo_method).assert_called_once()
@@ -0,0 +1,94 @@
+"""
+Unit tests for the per-request user cache in the auth middleware.
+
+load_user() keeps the JWT user on g.current_user so the auth decorators
+and get_current_user() share one SELECT; a before_request hook clears it.
+"""
+
+import pytest
+from flask import g
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.middleware import permissions
+from app.middleware.auth import admin_required, get_current_user, load_user
+from app.middleware.permissions import require_permission
+
+
+@pytest.fixture
+def user_selects():
+    """Record the SELECT statements issued against the users table."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT') and 'FROM users' in statement:
+            statements.append(statement)
+
+    event.listen(Engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(Engine, 'before_cursor_execute', record)
+
+
+class TestLoadUser:
+    """Test suite for the request-scoped user cache"""
+
+    def test_decorated_view_loads_user_once(self, app, db_session, sample_admin,
+                                            auth_headers_admin, user_selects):
+        """Test a decorated view that also calls get_current_user() runs one SELECT"""
+        @admin_required()
+        def view():
+            return get_current_user()
+
+        with app.test_request_context(headers=auth_headers_admin):
+            app.preprocess_request()
+            user = view()
+
+        assert user.id == sample_admin.id
+        assert len(user_selects) == 1
+
+    def test_cache_cleared_between_requests(self, app, db_session, sample_admin, user_selects):
+        """Test the cache doesn't leak into the next request on the same app context"""
+        with app.test_request_context():
+            app.preprocess_request()
+            load_user(sample_admin.id)
+            assert g.current_user.id == sample_admin.id
+
+        with app.test_request_context():
+            app.preprocess_request()
+            assert 'current_user' not in g
+            load_user(sample_admin.id)
+
+        assert len(user_selects) == 2
+
+    def test_different_id_reloads_user(self, app, db_session, sample_admin, sample_user, user_selects):
+        """Test asking for another user id replaces the cached user"""
+        with app.test_request_context():
+            first = load_user(sample_admin.id)
+            second = load_user(str(sample_user.id))
+
+            assert first.id == sample_admin.id
+            assert second.id == sample_user.id
+            assert g.current_user is second
+
+        assert len(user_selects) == 2
+
+    def test_missing_id_returns_none(self, app, db_session, user_selects):
+        """Test an identity without a user id loads nothing"""
+        with app.test_request_context():
+            assert load_user(None) is None
+
+        assert user_selects == []
+
+    def test_dict_identity_without_user_id_is_user_not_found(self, app, db_session, monkeypatch):
+        """Test permission decorators report 'User not found' for a dict identity without user_id"""
+        monkeypatch.setattr(permissions, 'verify_jwt_in_request', lambda: None)
+        monkeypatch.setattr(permissions, 'get_jwt_identity', lambda: {'email': 'someone@example.com'})
+
+        @require_permission('view_users')
+        def view():
+            return 'ok'
+
+        with app.test_request_context():
+            response, status = view()
+
+        assert status == 401
+        assert response.get_json()['error'] == 'User not found'
@@ -5,7 +5,10 @@ Tests the EventBus singleton including publishing, subscribing, history, and sta
 """
 
 import pytest
+import sys
+import threading
 from datetime import datetime, timedelta
+from itertools import count
 from app.patterns.event_bus import EventBus
 from app.patterns.observer import Event, Observer
 
@@ -29,21 +32,44 @@ class MockObserver(Observer):
         self.events_received.append(event)
 
 
+class AsyncMockObserver(MockObserver):
+    """Mock observer that asks to be dispatched on the thread pool."""
+
+    prefers_async = True
+
+    def __init__(self, observer_name: str, should_fail: bool = False):
+        super().__init__(observer_name, should_fail)
+        self.thread_name = None
+        self.done = threading.Event()
+
+    def update(self, event: Event) -> None:
+        self.thread_name = threading.current_thread().name
+        try:
+            super().update(event)
+        finally:
+            self.done.set()
+
+
 @pytest.fixture
 def event_bus():
     """Provide clean EventBus instance for each test."""
-    # Clear singleton instance
-    if hasattr(EventBus, '_instances'):
-        EventBus._instances.clear()
-
-    bus = EventBus()
-    bus.clear_history()
-    bus.clear_observers()
-    yield bus
+    yield EventBus._reset_for_tests()
 
     # Cleanup
-    bus.clear_history()
-    bus.clear_observers()
+    EventBus._reset_for_tests()
+
+
+@pytest.fixture
+def fake_clock(event_bus, monkeypatch):
+    """Stamp events from a clock that advances one second per reading."""
+    ticks = count()
+    start = datetime(2024, 1, 1)
+
+    def clock():
+        return start + timedelta(seconds=next(ticks))
+
+    monkeypatch.setattr(event_bus, '_clock', clock)
+    return clock
 
 
 class TestEventBusSingleton:
@@ -119,6 +145,115 @@ class TestEventBusPublish:
 
         assert event1.event_id != event2.event_id
 
+    def test_publish_many_matches_single_publishes(self, event_bus):
+        """Test batch publishing records and dispatches each event in order."""
+        observer = MockObserver('Observer1')
+        event_bus.subscribe('EVENT_A', observer)
+
+        events = event_bus.publish_many([
+            ('EVENT_A', {'index': 0}, 'ServiceA'),
+            ('EVENT_B', {'index': 1}, None),
+            ('EVENT_A', {'index': 2}, 'ServiceA'),
+        ])
+
+        assert [e.data['index'] for e in events] == [0, 1, 2]
+        assert observer.events_received == [events[0], events[2]]
+        assert event_bus.get_history() == events[::-1]
+        assert event_bus.get_history_count(event_type='EVENT_A') == 2
+        assert events[1].source is None
+
+
+class TestEventBusAsyncPublish:
+    """Test thread-pool dispatch for async-preferring observers."""
+
+    def test_sync_publish_runs_all_observers_inline(self, event_bus):
+        """Test that the default publish keeps async observers inline."""
+        observer = AsyncMockObserver('AsyncObserver')
+        event_bus.subscribe('TEST_EVENT', observer)
+
+        event_bus.publish('TEST_EVENT', {})
+
+        assert len(observer.events_received) == 1
+        assert observer.thread_name == threading.current_thread().name
+
+    def test_async_publish_defers_only_async_observers(self, event_bus):
+        """Test that sync=False runs prefers_async observers on the pool."""
+        inline_observer = MockObserver('InlineObserver')
+        async_observer = AsyncMockObserver('AsyncObserver')
+        event_bus.subscribe('TEST_EVENT', inline_observer)
+        event_bus.subscribe('TEST_EVENT', async_observer)
+
+        event_bus.publish('TEST_EVENT', {}, sync=False)
+
+        # Inline observers have run by the time publish returns
+        assert len(inline_observer.events_received) == 1
+
+        assert async_observer.done.wait(timeout=5)
+        assert len(async_observer.events_received) == 1
+        assert async_observer.thread_name.startswith('evbus')
+
+    def test_async_observer_failure_does_not_raise(self, event_bus):
+        """Test that a failing deferred observer is isolated."""
+        bad_observer = AsyncMockObserver('BadObserver', should_fail=True)
+        good_observer = MockObserver('GoodObserver')
+        event_bus.subscribe('TEST_EVENT', bad_observer)
+        event_bus.subscribe('TEST_EVENT', good_observer)
+
+        event_bus.publish('TEST_EVENT', {}, sync=False)
+
+        assert bad_observer.done.wait(timeout=5)
+        assert len(good_observer.events_received) == 1
+
+    def test_reset_for_tests_shuts_down_pool(self, event_bus):
+        """Test that _reset_for_tests stops the pool's worker threads."""
+        observer = AsyncMockObserver('AsyncObserver')
+        event_bus.subscribe('TEST_EVENT', observer)
+        event_bus.publish('TEST_EVENT', {}, sync=False)
+        assert observer.done.wait(timeout=5)
+
+        EventBus._reset_for_tests()
+
+        assert not [t for t in threading.enumerate() if t.name.startswith('evbus')]
+
+    @pytest.fixture
+    def frequent_thread_switches(self):
+        """Make the interpreter switch threads far more often than by default."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        yield
+        sys.setswitchinterval(interval)
+
+    def test_concurrent_publishes_keep_type_index_in_step(self, event_bus, frequent_thread_switches):
+        """Test that publishing from several threads keeps history and index consistent."""
+        event_bus.set_max_history_size(50)
+        start = threading.Barrier(4)
+        errors = []
+
+        def publish_events(event_type):
+            start.wait()
+            try:
+                for i in range(2000):
+                    event_bus.publish(event_type, {'i': i})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=publish_events, args=(f'TYPE_{n}',)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        history = event_bus.get_history(limit=50)
+        assert len(history) == 50
+        for n in range(4):
+            event_type = f'TYPE_{n}'
+            assert event_bus.get_history(event_type, limit=50) == [
+                e for e in history if e.event_type == event_type
+            ]
+
 
 class TestEventBusSubscribe:
     """Test subscription functionality."""
@@ -184,13 +319,10 @@ class TestEventBusHistory:
 
         assert len(history) == 5
 
-    def test_get_history_returns_newest_first(self, event_bus):
-        """Test that history is returned newest first."""
-        import time
+    def test_get_history_returns_most_recently_recorded_first(self, event_bus, fake_clock):
+        """Test that history is returned most recently recorded first."""
         event_bus.publish('TEST', {'index': 1})
-        time.sleep(0.01)  # Small delay to ensure different timestamps
         event_bus.publish('TEST', {'index': 2})
-        time.sleep(0.01)
         event_bus.publish('TEST', {'index': 3})
 
         history = event_bus.get_history()
@@ -199,17 +331,13 @@ class TestEventBusHistory:
         assert history[1].data['index'] == 2
         assert history[2].data['index'] == 1
 
-    def test_get_history_filtered_by_time(self, event_bus):
+    def test_get_history_filtered_by_time(self, event_bus, fake_clock):
         """Test filtering history by timestamp."""
-        import time
         event_bus.publish('TEST', {'old': True})
 
-        time.sleep(0.01)  # Small delay to ensure cutoff is after old event
-
         # Events published after this should be returned
-        cutoff = datetime.utcnow()
+        cutoff = fake_clock()
 
-        time.sleep(0.01)
         event_bus.publish('TEST', {'new': True})
 
         history = event_bus.get_history(since=cutoff)
@@ -217,6 +345,37 @@ class TestEventBusHistory:
         assert len(history) == 1
         assert history[0].data.get('new') == True
 
+    def test_get_history_since_combined_with_type(self, event_bus, fake_clock):
+        """Test that the time cutoff applies within a type-filtered history."""
+        event_bus.publish('EVENT_A', {})
+        event_bus.publish('EVENT_B', {})
+        cutoff = fake_clock()
+        for index, event_type in enumerate(['EVENT_A', 'EVENT_B', 'EVENT_A']):
+            event_bus.publish(event_type, {'index': index})
+
+        history = event_bus.get_history('EVENT_A', since=cutoff)
+
+        assert [e.data['index'] for e in history] == [2, 0]
+        assert event_bus.get_history_count(since=cutoff) == 3
+
+    def test_get_history_since_with_out_of_order_timestamps(self, event_bus, fake_clock):
+        """Test that an older event recorded late doesn't hide newer ones."""
+        event_bus.publish('TEST', {'index': 0})
+        cutoff = fake_clock()
+        event_bus.publish('TEST', {'index': 1})
+        # Stamped before the cutoff but appended after index 1, as when a
+        # concurrent publish or a clock step reorders history
+        late = event_bus.publish('TEST', {'index': 2})
+        late.timestamp = cutoff - timedelta(seconds=5)
+        event_bus.publish('TEST', {'index': 3})
+
+        history = event_bus.get_history(since=cutoff)
+
+        assert [e.data['index'] for e in history] == [3, 1]
+        assert event_bus.get_history_count(since=cutoff) == 2
+        # Without a cutoff, order is still the order events were recorded
+        assert [e.data['index'] for e in event_bus.get_history()] == [3, 2, 1, 0]
+
     def test_get_history_filtered_by_source(self, event_bus):
         """Test filtering history by source."""
         event_bus.publish('TEST', {}, source='ServiceA')
@@ -280,13 +439,11 @@ class TestEventBusHistoryManagement:
 
     def test_history_trim_on_overflow(self, event_bus):
         """Test that history is trimmed when exceeding max size."""
-        import time
         event_bus.set_max_history_size(5)
 
         # Publish more events than max size
         for i in range(10):
             event_bus.publish('TEST', {'index': i})
-            time.sleep(0.001)  # Tiny delay for ordering
 
         history = event_bus.get_history(limit=100)
 
@@ -296,6 +453,22 @@ class TestEventBusHistoryManagement:
         indices = sorted([h.data['index'] for h in history])
         assert indices == [5, 6, 7, 8, 9]
 
+    def test_history_trim_updates_type_counts(self, event_bus):
+        """Test that per-type queries drop events trimmed from history."""
+        event_bus.set_max_history_size(4)
+
+        for i in range(6):
+            event_bus.publish('EVEN' if i % 2 == 0 else 'ODD', {'index': i})
+
+        assert event_bus.get_history_count(event_type='EVEN') == 2
+        assert [e.data['index'] for e in event_bus.get_history('ODD')] == [5, 3]
+
+        event_bus.set_max_history_size(1)
+
+        assert event_bus.get_history_count(event_type='EVEN') == 0
+        assert event_bus.get_history('EVEN') == []
+        assert event_bus.get_statistics()['event_type_counts'] == {'ODD': 1}
+
     def test_history_trim_when_reducing_max_size(self, event_bus):
         """Test trimming history when reducing max size."""
         event_bus.set_max_history_size(100)
@@ -418,6 +591,19 @@ class TestEventBusIntegration:
         # Good observer should still receive event
         assert len(good_observer.events_received) == 1
 
+    def test_reset_for_tests_keeps_instance(self, event_bus):
+        """Test that resetting clears state without replacing the singleton."""
+        event_bus.subscribe('TEST', MockObserver('Observer1'))
+        event_bus.publish('TEST', {})
+        event_bus.set_max_history_size(5)
+
+        bus = EventBus._reset_for_tests()
+
+        assert bus is event_bus
+        assert bus.get_observer_count() == 0
+        assert bus.get_history_count() == 0
+        assert bus.get_max_history_size() == 1000
+
     def test_repr(self, event_bus):
         """Test string representation."""
         event_bus.publish('TEST', {})
@@ -19,195 +19,207 @@ from app.models import (
 )
 
 
+def assert_fields(request, expected):
+    """Assert request attributes match expected values and their types."""
+    for field, value in expected.items():
+        actual = getattr(request, field)
+        assert actual == value and type(actual) is type(value), field
+
+
+# (request_type, request class, create_request kwargs, expected fields)
+CREATE_REQUEST_CASES = [
+    pytest.param(
+        RequestType.ELECTRICAL, ElectricalRequest,
+        {
+            'title': 'Power outlet issue',
+            'description': 'Outlet in room 201 not working',
+            'priority': RequestPriority.HIGH,
+            'voltage': '120V',
+            'circuit_number': 'C12',
+            'is_emergency': True,
+        },
+        {
+            'title': 'Power outlet issue',
+            'description': 'Outlet in room 201 not working',
+            # Emergency automatically sets priority to URGENT (validated in model)
+            'priority': RequestPriority.URGENT,
+            'status': RequestStatus.SUBMITTED,
+            'voltage': '120V',
+            'circuit_number': 'C12',
+            'is_emergency': True,
+        },
+        id='electrical'
+    ),
+    pytest.param(
+        RequestType.PLUMBING, PlumbingRequest,
+        {
+            'title': 'Pipe leak',
+            'description': 'Water leaking from bathroom sink',
+            'pipe_type': 'PVC',
+            'leak_severity': 'severe',
+            'water_shutoff_required': True,
+        },
+        {
+            'title': 'Pipe leak',
+            'pipe_type': 'PVC',
+            'leak_severity': 'severe',
+            'water_shutoff_required': True,
+        },
+        id='plumbing'
+    ),
+    pytest.param(
+        RequestType.HVAC, HVACRequest,
+        {
+            'title': 'AC not cooling',
+            'description': 'Server room temperature too high',
+            'system_type': 'cooling',
+            'temperature_issue': 'Room at 85°F',
+            'refrigerant_leak': False,
+        },
+        {
+            'system_type': 'cooling',
+            'temperature_issue': 'Room at 85°F',
+            'refrigerant_leak': False,
+        },
+        id='hvac'
+    ),
+]
+
+# (convenience method name, request class, kwargs, expected fields)
+CONVENIENCE_CASES = [
+    pytest.param(
+        'create_electrical_request', ElectricalRequest,
+        {
+            'title': 'Circuit breaker tripped',
+            'description': 'Main breaker keeps tripping',
+            'breaker_location': 'Panel A',
+            'is_emergency': True,
+        },
+        {'breaker_location': 'Panel A', 'is_emergency': True},
+        id='electrical'
+    ),
+    pytest.param(
+        'create_plumbing_request', PlumbingRequest,
+        {
+            'title': 'Clogged drain',
+            'description': 'Kitchen sink not draining',
+            'water_shutoff_required': False,
+        },
+        {'water_shutoff_required': False},
+        id='plumbing'
+    ),
+    pytest.param(
+        'create_hvac_request', HVACRequest,
+        {
+            'title': 'Heater malfunction',
+            'description': 'Office heating not working',
+            'system_type': 'heating',
+            'priority': RequestPriority.URGENT,
+        },
+        {'system_type': 'heating', 'priority': RequestPriority.URGENT},
+        id='hvac'
+    ),
+]
+
+# (request class, API payload without ids, expected fields)
+FROM_DICT_CASES = [
+    pytest.param(
+        ElectricalRequest,
+        {
+            'type': 'electrical',
+            'title': 'Faulty wiring',
+            'description': 'Sparks from outlet',
+            'priority': 'urgent',
+            'voltage': '240V',
+            'is_emergency': True,
+        },
+        {
+            'title': 'Faulty wiring',
+            'priority': RequestPriority.URGENT,
+            'voltage': '240V',
+            'is_emergency': True,
+        },
+        id='electrical'
+    ),
+    pytest.param(
+        PlumbingRequest,
+        {
+            'type': 'plumbing',
+            'title': 'Burst pipe',
+            'description': 'Water flooding floor',
+            'leak_severity': 'severe',
+            'water_shutoff_required': True,
+        },
+        {'leak_severity': 'severe', 'water_shutoff_required': True},
+        id='plumbing'
+    ),
+    pytest.param(
+        HVACRequest,
+        {
+            'type': 'hvac',
+            'title': 'Ventilation issue',
+            'description': 'Poor air circulation',
+            'system_type': 'ventilation',
+        },
+        {'system_type': 'ventilation'},
+        id='hvac'
+    ),
+]
+
+
 class TestMaintenanceRequestFactory:
     """Test suite for MaintenanceRequestFactory (Factory Pattern)"""
 
     @pytest.fixture(autouse=True)
-    def setup(self, db_session, sample_user, sample_asset):
+    def setup(self):
         """Set up test dependencies"""
+        # The factory builds transient objects, so plain ids are enough
         self.factory = MaintenanceRequestFactory()
-        self.submitter_id = sample_user.id
-        self.asset_id = sample_asset.id
+        self.submitter_id = 1
+        self.asset_id = 1
 
-    def test_create_electrical_request(self, db_session):
-        """Test factory creates ElectricalRequest instance"""
+    @pytest.mark.parametrize('request_type,request_class,kwargs,expected', CREATE_REQUEST_CASES)
+    def test_create_request(self, request_type, request_class, kwargs, expected):
+        """Test factory creates the subclass registered for each request type"""
         request = self.factory.create_request(
-            request_type=RequestType.ELECTRICAL,
-            title='Power outlet issue',
-            description='Outlet in room 201 not working',
+            request_type=request_type,
             submitter_id=self.submitter_id,
             asset_id=self.asset_id,
-            priority=RequestPriority.HIGH,
-            voltage='120V',
-            circuit_number='C12',
-            is_emergency=True
+            **kwargs
         )
 
         # Verify correct type created
-        assert isinstance(request, ElectricalRequest)
-        assert request.type == RequestType.ELECTRICAL.value
+        assert isinstance(request, request_class)
+        assert request.type == request_type.value
 
-        # Verify common fields
-        assert request.title == 'Power outlet issue'
-        assert request.description == 'Outlet in room 201 not working'
+        # Verify common and type-specific fields
         assert request.submitter_id == self.submitter_id
         assert request.asset_id == self.asset_id
-        # Emergency automatically sets priority to URGENT (validated in model)
-        assert request.priority == RequestPriority.URGENT
-        assert request.status == RequestStatus.SUBMITTED
-
-        # Verify electrical-specific fields
-        assert request.voltage == '120V'
-        assert request.circuit_number == 'C12'
-        assert request.is_emergency is True
+        assert_fields(request, expected)
 
-    def test_create_plumbing_request(self, db_session):
-        """Test factory creates PlumbingRequest instance"""
-        request = self.factory.create_request(
-            request_type=RequestType.PLUMBING,
-            title='Pipe leak',
-            description='Water leaking from bathroom sink',
+    @pytest.mark.parametrize('method,request_class,kwargs,expected', CONVENIENCE_CASES)
+    def test_create_request_convenience_method(self, method, request_class, kwargs, expected):
+        """Test per-type convenience factory methods"""
+        request = getattr(self.factory, method)(
             submitter_id=self.submitter_id,
             asset_id=self.asset_id,
-            pipe_type='PVC',
-            leak_severity='severe',
-            water_shutoff_required=True
+            **kwargs
         )
 
-        # Verify correct type created
-        assert isinstance(request, PlumbingRequest)
-        assert request.type == RequestType.PLUMBING.value
-
-        # Verify common fields
-        assert request.title == 'Pipe leak'
-        assert request.submitter_id == self.submitter_id
-
-        # Verify plumbing-specific fields
-        assert request.pipe_type == 'PVC'
-        assert request.leak_severity == 'severe'
-        assert request.water_shutoff_required is True
+        assert isinstance(request, request_class)
+        assert_fields(request, expected)
 
-    def test_create_hvac_request(self, db_session):
-        """Test factory creates HVACRequest instance"""
-        request = self.factory.create_request(
-            request_type=RequestType.HVAC,
-            title='AC not cooling',
-            description='Server room temperature too high',
-            submitter_id=self.submitter_id,
-            asset_id=self.asset_id,
-            system_type='cooling',
-            temperature_issue='Room at 85°F',
-            refrigerant_leak=False
-        )
-
-        # Verify correct type created
-        assert isinstance(request, HVACRequest)
-        assert request.type == RequestType.HVAC.value
-
-        # Verify hvac-specific fields
-        assert request.system_type == 'cooling'
-        assert request.temperature_issue == 'Room at 85°F'
-        assert request.refrigerant_leak is False
-
-    def test_create_electrical_request_convenience_method(self, db_session):
-        """Test electrical convenience factory method"""
-        request = self.factory.create_electrical_request(
-            title='Circuit breaker tripped',
-            description='Main breaker keeps tripping',
-            submitter_id=self.submitter_id,
-            asset_id=self.asset_id,
-            breaker_location='Panel A',
-            is_emergency=True
-        )
-
-        assert isinstance(request, ElectricalRequest)
-        assert request.breaker_location == 'Panel A'
-        assert request.is_emergency is True
-
-    def test_create_plumbing_request_convenience_method(self, db_session):
-        """Test plumbing convenience factory method"""
-        request = self.factory.create_plumbing_request(
-            title='Clogged drain',
-            description='Kitchen sink not draining',
-            submitter_id=self.submitter_id,
-            asset_id=self.asset_id,
-            water_shutoff_required=False
-        )
-
-        assert isinstance(request, PlumbingRequest)
-        assert request.water_shutoff_required is False
-
-    def test_create_hvac_request_convenience_method(self, db_session):
-        """Test HVAC convenience factory method"""
-        request = self.factory.create_hvac_request(
-            title='Heater malfunction',
-            description='Office heating not working',
-            submitter_id=self.submitter_id,
-            asset_id=self.asset_id,
-            system_type='heating',
-            priority=RequestPriority.URGENT
-        )
-
-        assert isinstance(request, HVACRequest)
-        assert request.system_type == 'heating'
-        assert request.priority == RequestPriority.URGENT
-
-    def test_create_request_from_dict_electrical(self, db_session):
+    @pytest.mark.parametrize('request_class,payload,expected', FROM_DICT_CASES)
+    def test_create_request_from_dict(self, request_class, payload, expected):
         """Test creating request from dictionary (API use case)"""
-        data = {
-            'type': 'electrical',
-            'title': 'Faulty wiring',
-            'description': 'Sparks from outlet',
-            'submitter_id': self.submitter_id,
-            'asset_id': self.asset_id,
-            'priority': 'urgent',
-            'voltage': '240V',
-            'is_emergency': True
-        }
-
-        request = self.factory.create_request_from_dict(data)
-
-        assert isinstance(request, ElectricalRequest)
-        assert request.title == 'Faulty wiring'
-        assert request.priority == RequestPriority.URGENT
-        assert request.voltage == '240V'
-        assert request.is_emergency is True
-
-    def test_create_request_from_dict_plumbing(self, db_session):
-        """Test creating plumbing request from dictionary"""
-        data = {
-            'type': 'plumbing',
-            'title': 'Burst pipe',
-            'description': 'Water flooding floor',
-            'submitter_id': self.submitter_id,
-            'asset_id': self.asset_id,
-            'leak_severity': 'severe',
-            'water_shutoff_required': True
-        }
-
-        request = self.factory.create_request_from_dict(data)
-
-        assert isinstance(request, PlumbingRequest)
-        assert request.leak_severity == 'severe'
-        assert request.water_shutoff_required is True
-
-    def test_create_request_from_dict_hvac(self, db_session):
-        """Test creating HVAC request from dictionary"""
-        data = {
-            'type': 'hvac',
-            'title': 'Ventilation issue',
-            'description': 'Poor air circulation',
-            'submitter_id': self.submitter_id,
-            'asset_id': self.asset_id,
-            'system_type': 'ventilation'
-        }
+        data = {**payload, 'submitter_id': self.submitter_id, 'asset_id': self.asset_id}
 
         request = self.factory.create_request_from_dict(data)
 
-        assert isinstance(request, HVACRequest)
-        assert request.system_type == 'ventilation'
+        assert isinstance(request, request_class)
+        assert_fields(request, expected)
 
-    def test_create_request_invalid_type(self, db_session):
+    def test_create_request_invalid_type(self):
         """Test factory raises error for invalid type"""
         with pytest.raises(ValueError, match="Invalid request type"):
             self.factory.create_request(
@@ -218,7 +230,7 @@ class TestMaintenanceRequestFactory:
                 asset_id=self.asset_id
             )
 
-    def test_create_request_from_dict_missing_type(self, db_session):
+    def test_create_request_from_dict_missing_type(self):
         """Test factory raises error when type missing"""
         data = {
             'title': 'Test',
@@ -230,7 +242,7 @@ class TestMaintenanceRequestFactory:
         with pytest.raises(ValueError, match="type is required"):
             self.factory.create_request_from_dict(data)
 
-    def test_create_request_from_dict_missing_required_fields(self, db_session):
+    def test_create_request_from_dict_missing_required_fields(self):
         """Test factory raises error when required fields missing"""
         data = {
             'type': 'electrical',
@@ -241,7 +253,7 @@ class TestMaintenanceRequestFactory:
         with pytest.raises(ValueError, match="is required"):
             self.factory.create_request_from_dict(data)
 
-    def test_create_request_from_dict_invalid_type_value(self, db_session):
+    def test_create_request_from_dict_invalid_type_value(self):
         """Test factory raises error for invalid type value"""
         data = {
             'type': 'invalid',
@@ -254,52 +266,30 @@ class TestMaintenanceRequestFactory:
         with pytest.raises(ValueError, match="Invalid request type"):
             self.factory.create_request_from_dict(data)
 
-    def test_electrical_emergency_auto_priority(self, db_session):
-        """Test electrical emergency automatically sets urgent priority"""
-        request = self.factory.create_electrical_request(
-            title='Emergency',
-            description='Test',
-            submitter_id=self.submitter_id,
-            asset_id=self.asset_id,
-            is_emergency=True,
-            priority=RequestPriority.LOW  # Will be overridden
-        )
-
-        # Validation in model should set to URGENT
-        request.validate()
-        assert request.priority == RequestPriority.URGENT
-
-    def test_plumbing_severe_leak_auto_priority(self, db_session):
-        """Test severe leak automatically increases priority"""
-        request = self.factory.create_plumbing_request(
-            title='Severe leak',
-            description='Test',
-            submitter_id=self.submitter_id,
-            asset_id=self.asset_id,
-            leak_severity='severe',
-            priority=RequestPriority.LOW  # Will be overridden
-        )
-
-        # Validation in model should increase priority
-        request.validate()
-        assert request.priority in [RequestPriority.HIGH, RequestPriority.URGENT]
-
-    def test_hvac_refrigerant_leak_auto_priority(self, db_session):
-        """Test refrigerant leak automatically increases priority"""
-        request = self.factory.create_hvac_request(
-            title='Refrigerant leak',
+    @pytest.mark.parametrize('method,flag,allowed', [
+        pytest.param('create_electrical_request', {'is_emergency': True},
+                     [RequestPriority.URGENT], id='electrical-emergency'),
+        pytest.param('create_plumbing_request', {'leak_severity': 'severe'},
+                     [RequestPriority.HIGH, RequestPriority.URGENT], id='plumbing-severe-leak'),
+        pytest.param('create_hvac_request', {'refrigerant_leak': True},
+                     [RequestPriority.HIGH, RequestPriority.URGENT], id='hvac-refrigerant-leak'),
+    ])
+    def test_critical_flags_raise_priority(self, method, flag, allowed):
+        """Test critical conditions automatically raise a LOW priority"""
+        request = getattr(self.factory, method)(
+            title='Critical issue',
             description='Test',
             submitter_id=self.submitter_id,
             asset_id=self.asset_id,
-            refrigerant_leak=True,
-            priority=RequestPriority.LOW  # Will be overridden
+            priority=RequestPriority.LOW,  # Will be overridden
+            **flag
         )
 
-        # Validation in model should increase priority
+        # Validation in model should raise the priority
         request.validate()
-        assert request.priority in [RequestPriority.HIGH, RequestPriority.URGENT]
+        assert request.priority in allowed
 
-    def test_get_supported_types(self, db_session):
+    def test_get_supported_types(self):
         """Test retrieving list of supported request types"""
         supported_types = self.factory.get_supported_types()
 
@@ -308,7 +298,53 @@ class TestMaintenanceRequestFactory:
         assert RequestType.HVAC in supported_types
         assert len(supported_types) == 3
 
-    def test_factory_pattern_polymorphism(self, db_session):
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        """Restore the factory registry after a test registers a type"""
+        factory = MaintenanceRequestFactory
+        monkeypatch.setattr(factory, '_request_types', dict(factory._request_types))
+        monkeypatch.setattr(factory, '_type_fields', dict(factory._type_fields))
+        monkeypatch.setattr(factory, '_supported_types', factory._supported_types)
+        return factory
+
+    def test_register_request_type_with_fields(self, registry):
+        """Test create_request_from_dict copies registered fields and their defaults"""
+        registry.register_request_type(
+            RequestType.ELECTRICAL, ElectricalRequest,
+            fields={'voltage': '240V', 'circuit_number': None}
+        )
+
+        request = registry.create_request_from_dict({
+            'type': 'electrical',
+            'title': 'Panel check',
+            'description': 'Test',
+            'submitter_id': self.submitter_id,
+            'circuit_number': 'C7',
+            'breaker_location': 'Basement',  # Not registered, so not copied
+        })
+
+        assert isinstance(request, ElectricalRequest)
+        assert request.voltage == '240V'
+        assert request.circuit_number == 'C7'
+        assert request.breaker_location is None
+
+    def test_register_request_type_without_fields_keeps_existing(self, registry):
+        """Test re-registering a type without fields keeps its field map"""
+        registry.register_request_type(RequestType.ELECTRICAL, ElectricalRequest)
+
+        request = registry.create_request_from_dict({
+            'type': 'electrical',
+            'title': 'Outlet',
+            'description': 'Test',
+            'submitter_id': self.submitter_id,
+            'voltage': '120V',
+            'circuit_number': 'C12',
+        })
+
+        assert request.voltage == '120V'
+        assert request.circuit_number == 'C12'
+
+    def test_factory_pattern_polymorphism(self):
         """
         Test Factory Pattern enables polymorphism.
 
@@ -338,7 +374,7 @@ class TestMaintenanceRequestFactory:
             assert hasattr(request, 'start_work')
             assert hasattr(request, 'complete')
 
-    def test_request_to_dict_includes_type_specific_fields(self, db_session):
+    def test_request_to_dict_includes_type_specific_fields(self):
         """Test serialization includes type-specific fields"""
         electrical = self.factory.create_electrical_request(
             title='Test',
@@ -4,6 +4,7 @@ Unit Tests for Observer Pattern
 Tests the core observer pattern implementation including Event, Observer, and Subject.
 """
 
+import os
 import pytest
 from datetime import datetime
 from app.patterns.observer import Event, Observer, Subject
@@ -63,6 +64,14 @@ class TestEvent:
         assert 'timestamp' in event_dict
         assert isinstance(event_dict['timestamp'], str)
 
+    def test_event_with_explicit_timestamp(self):
+        """Test creating an event with a given timestamp."""
+        timestamp = datetime(2024, 1, 1, 9, 30)
+        event = Event('TEST_EVENT', {}, timestamp=timestamp)
+
+        assert event.timestamp == timestamp
+        assert event.to_dict()['timestamp'] == '2024-01-01T09:30:00'
+
     def test_event_repr(self):
         """Test event string representation."""
         event = Event('TEST_EVENT', {}, source='TestSource')
@@ -79,6 +88,35 @@ class TestEvent:
 
         assert event1.event_id != event2.event_id
 
+    def test_event_ids_unique_across_many_events(self):
+        """Test that event IDs stay unique across many events."""
+        ids = [Event('TEST', {}).event_id for _ in range(1000)]
+
+        assert len(set(ids)) == 1000
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+    def test_event_ids_differ_across_processes(self):
+        """Test that two processes at the same sequence number get distinct IDs."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child: the counter state was copied from the parent at fork
+            os.close(read_fd)
+            os.write(write_fd, Event('TEST', {}).event_id.encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        parent_id = Event('TEST', {}).event_id
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            child_id = pipe.read().decode()
+
+        # Same sequence number, but the leading characters shown when an ID
+        # is shortened come from the per-process prefix and still differ
+        assert child_id[-12:] == parent_id[-12:]
+        assert child_id[:8] != parent_id[:8]
+        assert child_id != parent_id
+
 
 class TestObserver:
     """Test Observer abstract class."""
@@ -231,6 +269,26 @@ class TestSubject:
         assert result['success_count'] == 2
         assert result['failure_count'] == 0
 
+    def test_observer_detaching_during_notify(self):
+        """Test that detaching mid-dispatch doesn't skip the remaining observers."""
+        subject = Subject()
+        observer2 = MockObserver('Observer2')
+
+        class DetachingObserver(MockObserver):
+            def update(self, event: Event) -> None:
+                subject.detach('TEST_EVENT', self)
+                super().update(event)
+
+        observer1 = DetachingObserver('Observer1')
+        subject.attach('TEST_EVENT', observer1)
+        subject.attach('TEST_EVENT', observer2)
+
+        result = subject.notify(Event('TEST_EVENT', {}))
+
+        assert result['success_count'] == 2
+        assert len(observer2.events_received) == 1
+        assert subject.get_observer_count('TEST_EVENT') == 1
+
     def test_notify_with_no_observers(self):
         """Test notifying when no observers are attached."""
         subject = Subject()
@@ -23,6 +23,11 @@ class TestNotificationObserver:
         observer = NotificationObserver(notification_service=None)
         assert observer.name == "NotificationObserver"
 
+    def test_runs_inline(self):
+        """Test notifications are not deferred to the EventBus thread pool."""
+        observer = NotificationObserver(notification_service=None)
+        assert observer.prefers_async is False
+
     def test_handles_request_created(self):
         """Test handling REQUEST_CREATED event."""
         observer = NotificationObserver(notification_service=None)
@@ -160,6 +165,15 @@ class TestMetricsObserver:
         assert metrics['technician_workload'][5] == 2
         assert metrics['technician_workload'][10] == 1
 
+    def test_get_workload(self):
+        """Test reading a single technician's workload."""
+        observer = MetricsObserver()
+
+        observer.update(Event(EventTypes.REQUEST_ASSIGNED, {'technician_id': 5}))
+
+        assert observer.get_workload(5) == 1
+        assert observer.get_workload(10) == 0
+
     def test_tracks_asset_created(self):
         """Test tracking asset creation."""
         observer = MetricsObserver()
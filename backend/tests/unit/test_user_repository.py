@@ -192,6 +192,14 @@ class TestUserRepository:
         assert sample_user.check_password('newpassword123') is True
         assert sample_user.check_password('password123') is False
 
+    def test_update_password_uses_configured_cost(self, app, db_session, sample_user):
+        """Test new hashes use the app's BCRYPT_LOG_ROUNDS"""
+        self.repo.update_password(sample_user.id, 'newpassword123')
+
+        db_session.session.refresh(sample_user)
+        rounds = app.config['BCRYPT_LOG_ROUNDS']
+        assert sample_user.password_hash.startswith(f'$2b${rounds:02d}$')
+
     def test_update_password_invalid(self, db_session, sample_user):
         """Test updating password with invalid value"""
         with pytest.raises(ValueError):